@@ -2,10 +2,25 @@
 Application Memory Module - DAY 18
 
 Tracks applied jobs to prevent duplicate applications.
-Stores application history in JSON format.
+Stores application history in a SQLite database (data/applied_jobs.db)
+with an indexed job_key column, so membership checks stay fast no matter
+how long the history grows. Jobs are identified by their canonical job
+key (see portals/job_key.py), so tracking-parameter variants of the same
+posting count as one job.
+
+The legacy JSON history (data/applied_jobs.json) is imported once,
+the first time the database is created.
+
+Application statistics (total, per status, per portal, per day) are
+materialized counters updated in the same transaction as each insert,
+so stats and summaries are O(1). Run
+    python app_logging/memory.py --verify-stats [--rebuild]
+to recompute them from scratch and report any drift.
 """
 
+import argparse
 import json
+import sqlite3
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -14,7 +29,223 @@ from datetime import datetime
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from portals.job_key import job_identity
+
 APPLIED_JOBS_FILE = Path(__file__).parent.parent / "data" / "applied_jobs.json"
+APPLIED_JOBS_DB = Path(__file__).parent.parent / "data" / "applied_jobs.db"
+
+RECORD_FIELDS = ("url", "job_key", "applied_at", "status", "portal", "job_title", "company", "location")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applied_jobs (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    job_key TEXT,
+    applied_at TEXT NOT NULL,
+    status TEXT NOT NULL,
+    portal TEXT NOT NULL,
+    job_title TEXT,
+    company TEXT,
+    location TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_applied_jobs_applied_at ON applied_jobs(applied_at);
+CREATE TABLE IF NOT EXISTS seen_jobs (
+    job_key TEXT PRIMARY KEY,
+    stage TEXT NOT NULL,
+    first_seen TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS application_stats (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    UNIQUE (kind, key)
+);
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# SQL is kept in constants so sqlite3's statement cache reuses the
+# prepared statements across calls.
+SQL_IS_APPLIED = "SELECT 1 FROM applied_jobs WHERE job_key = ? LIMIT 1"
+SQL_INSERT = (
+    "INSERT INTO applied_jobs (url, job_key, applied_at, status, portal, job_title, company, location) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+SQL_IS_SEEN = "SELECT 1 FROM seen_jobs WHERE job_key = ? LIMIT 1"
+SQL_INSERT_SEEN = "INSERT OR IGNORE INTO seen_jobs (job_key, stage, first_seen) VALUES (?, ?, ?)"
+SQL_BUMP_STAT = (
+    "INSERT INTO application_stats (kind, key, count) VALUES (?, ?, 1) "
+    "ON CONFLICT (kind, key) DO UPDATE SET count = count + 1"
+)
+SQL_SELECT_ALL = (
+    "SELECT url, job_key, applied_at, status, portal, job_title, company, location "
+    "FROM applied_jobs ORDER BY id"
+)
+
+_connection = None
+
+
+def get_connection() -> sqlite3.Connection:
+    """
+    Open (once per process) the application store.
+    
+    Creates the schema on first use and imports the legacy JSON
+    history if the database is new.
+    
+    Returns:
+        sqlite3.Connection: Shared connection to data/applied_jobs.db
+    """
+    global _connection
+    
+    if _connection is None:
+        APPLIED_JOBS_DB.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(APPLIED_JOBS_DB), cached_statements=64)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        _ensure_job_key_column(conn)
+        _connection = conn
+        
+        imported = conn.execute(
+            "SELECT value FROM store_meta WHERE key = 'json_imported'"
+        ).fetchone()
+        if imported is None:
+            import_json_history(APPLIED_JOBS_FILE)
+        migrate_job_keys()
+        
+        stats_built = conn.execute(
+            "SELECT value FROM store_meta WHERE key = 'stats_built'"
+        ).fetchone()
+        if stats_built is None:
+            with conn:
+                _rebuild_stats(conn)
+    
+    return _connection
+
+
+def _ensure_job_key_column(conn: sqlite3.Connection):
+    """Add the job_key column to databases created before it existed."""
+    columns = [row["name"] for row in conn.execute("PRAGMA table_info(applied_jobs)")]
+    if "job_key" not in columns:
+        conn.execute("ALTER TABLE applied_jobs ADD COLUMN job_key TEXT")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_applied_jobs_job_key ON applied_jobs(job_key)"
+    )
+
+
+def close_connection():
+    """
+    Close the shared connection (it is reopened on next use).
+    """
+    global _connection
+    
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+
+
+def _record_to_row(record: dict) -> tuple:
+    """Convert a job record dictionary to an insert row."""
+    url = record.get("url", "")
+    return (
+        url,
+        record.get("job_key") or job_identity(url),
+        record.get("applied_at") or datetime.now().isoformat(),
+        record.get("status", "UNKNOWN"),
+        record.get("portal", "Unknown"),
+        record.get("job_title"),
+        record.get("company"),
+        record.get("location")
+    )
+
+
+def _row_to_record(row: sqlite3.Row) -> dict:
+    """Convert a database row to a job record dictionary."""
+    record = {}
+    for field in RECORD_FIELDS:
+        if row[field] is not None:
+            record[field] = row[field]
+    return record
+
+
+def import_json_history(json_path: Path = APPLIED_JOBS_FILE) -> int:
+    """
+    One-shot import of the legacy JSON history into the database.
+    
+    Accepts both the record list written by this module and the
+    {"applied_jobs": [url, ...]} document written by memory/memory.py.
+    Running it again is a no-op.
+    
+    Args:
+        json_path: Path to the legacy JSON file
+    
+    Returns:
+        int: Number of records imported
+    """
+    conn = get_connection()
+    
+    already = conn.execute(
+        "SELECT value FROM store_meta WHERE key = 'json_imported'"
+    ).fetchone()
+    if already is not None:
+        return 0
+    
+    records = []
+    if json_path.exists():
+        try:
+            data = json.loads(json_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = []
+        
+        if isinstance(data, dict):
+            data = data.get("applied_jobs", [])
+        
+        for item in data if isinstance(data, list) else []:
+            if isinstance(item, str):
+                records.append({"url": item, "status": "APPLIED", "portal": "Indeed"})
+            elif isinstance(item, dict) and item.get("url"):
+                records.append(item)
+    
+    with conn:
+        conn.executemany(SQL_INSERT, [_record_to_row(r) for r in records])
+        conn.execute(
+            "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('json_imported', ?)",
+            (datetime.now().isoformat(),)
+        )
+        _rebuild_stats(conn)
+    
+    if records:
+        print(f"💾 Imported {len(records)} applications from {json_path.name}")
+    return len(records)
+
+
+def migrate_job_keys() -> int:
+    """
+    Re-key stored history: fill in job_key for records that lack one.
+    
+    Returns:
+        int: Number of records re-keyed
+    """
+    conn = get_connection()
+    
+    rows = conn.execute(
+        "SELECT id, url FROM applied_jobs WHERE job_key IS NULL"
+    ).fetchall()
+    if not rows:
+        return 0
+    
+    with conn:
+        conn.executemany(
+            "UPDATE applied_jobs SET job_key = ? WHERE id = ?",
+            [(job_identity(row["url"]), row["id"]) for row in rows]
+        )
+    
+    print(f"💾 Re-keyed {len(rows)} applications by job key")
+    return len(rows)
 
 
 def load_applied_jobs() -> list:
@@ -24,45 +255,38 @@ def load_applied_jobs() -> list:
     Returns:
         list: List of applied job records
     """
-    if not APPLIED_JOBS_FILE.exists():
-        return []
-    
-    try:
-        with open(APPLIED_JOBS_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            return data if isinstance(data, list) else []
-    except:
-        return []
+    conn = get_connection()
+    return [_row_to_record(row) for row in conn.execute(SQL_SELECT_ALL)]
 
 
 def save_applied_jobs(jobs: list):
     """
-    Save applied jobs list to file.
+    Replace the stored application history.
     
     Args:
         jobs: List of applied job records
     """
-    with open(APPLIED_JOBS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(jobs, f, indent=2, ensure_ascii=False)
+    conn = get_connection()
+    with conn:
+        conn.execute("DELETE FROM applied_jobs")
+        conn.executemany(SQL_INSERT, [_record_to_row(j) for j in jobs])
+        _rebuild_stats(conn)
 
 
 def is_job_applied(job_url: str) -> bool:
     """
     Check if a job has already been applied to.
     
+    Any URL variant of the same posting matches (compared by job key).
+    
     Args:
         job_url: URL of the job
     
     Returns:
         bool: True if job was already applied to
     """
-    jobs = load_applied_jobs()
-    
-    for job in jobs:
-        if job.get("url") == job_url:
-            return True
-    
-    return False
+    conn = get_connection()
+    return conn.execute(SQL_IS_APPLIED, (job_identity(job_url),)).fetchone() is not None
 
 
 def mark_job_applied(job_url: str, job_data: dict = None, status: str = "APPLIED") -> dict:
@@ -77,11 +301,10 @@ def mark_job_applied(job_url: str, job_data: dict = None, status: str = "APPLIED
     Returns:
         dict: The applied job record
     """
-    jobs = load_applied_jobs()
-    
     # Create job record
     record = {
         "url": job_url,
+        "job_key": job_identity(job_url),
         "applied_at": datetime.now().isoformat(),
         "status": status,
         "portal": "Indeed"
@@ -93,24 +316,139 @@ def mark_job_applied(job_url: str, job_data: dict = None, status: str = "APPLIED
         record["company"] = job_data.get("company", "Unknown")
         record["location"] = job_data.get("location", "Unknown")
     
-    jobs.append(record)
-    save_applied_jobs(jobs)
+    row = _record_to_row(record)
+    
+    conn = get_connection()
+    with conn:
+        conn.execute(SQL_INSERT, row)
+        _bump_stats(conn, row)
     
     print(f"💾 Job marked as applied: {record.get('job_title', job_url[:50])}")
     return record
 
 
+def is_job_seen(job_url: str) -> bool:
+    """
+    Check if a job has ever been read or evaluated (exact lookup).
+    
+    Callers that check many URLs should go through
+    app_logging.seen_filter, which answers most misses without a query.
+    
+    Args:
+        job_url: URL of the job
+    
+    Returns:
+        bool: True if the job key is in the seen store
+    """
+    conn = get_connection()
+    return conn.execute(SQL_IS_SEEN, (job_identity(job_url),)).fetchone() is not None
+
+
+def mark_jobs_seen(job_urls: list, stage: str = "read") -> int:
+    """
+    Record jobs as seen so they are never opened again.
+    
+    Args:
+        job_urls: URLs of the jobs
+        stage: Pipeline stage that saw them (read, evaluated, duplicate...)
+    
+    Returns:
+        int: Number of job keys that were new to the store
+    """
+    conn = get_connection()
+    now = datetime.now().isoformat()
+    before = conn.total_changes
+    with conn:
+        conn.executemany(
+            SQL_INSERT_SEEN,
+            [(job_identity(url), stage, now) for url in job_urls if url]
+        )
+    return conn.total_changes - before
+
+
+def iter_seen_job_keys():
+    """
+    Iterate over every job key in the seen store.
+    
+    Yields:
+        str: Job key
+    """
+    conn = get_connection()
+    for (job_key,) in conn.execute("SELECT job_key FROM seen_jobs"):
+        yield job_key
+
+
+def _bump_stats(conn: sqlite3.Connection, row: tuple):
+    """
+    Update the materialized counters for one inserted record.
+    
+    Args:
+        conn: Connection inside the insert's transaction
+        row: Insert row produced by _record_to_row
+    """
+    applied_at, status, portal = row[2], row[3], row[4]
+    conn.executemany(SQL_BUMP_STAT, [
+        ("total", ""),
+        ("status", status),
+        ("portal", portal),
+        ("day", applied_at[:10])
+    ])
+
+
+def _count_stats_from_records(conn: sqlite3.Connection) -> dict:
+    """
+    Recompute all counters by walking the application records.
+    
+    Returns:
+        dict: {(kind, key): count}, in order of first occurrence
+    """
+    counts = {("total", ""): conn.execute("SELECT COUNT(*) FROM applied_jobs").fetchone()[0]}
+    
+    queries = {
+        "status": "SELECT status, COUNT(*) FROM applied_jobs GROUP BY status ORDER BY MIN(id)",
+        "portal": "SELECT portal, COUNT(*) FROM applied_jobs GROUP BY portal ORDER BY MIN(id)",
+        "day": (
+            "SELECT substr(applied_at, 1, 10), COUNT(*) FROM applied_jobs "
+            "GROUP BY substr(applied_at, 1, 10) ORDER BY MIN(id)"
+        )
+    }
+    for kind, query in queries.items():
+        for key, count in conn.execute(query):
+            counts[(kind, key)] = count
+    
+    return counts
+
+
+def _rebuild_stats(conn: sqlite3.Connection):
+    """
+    Replace the materialized counters with freshly computed ones.
+    
+    Must be called inside a transaction on conn.
+    """
+    conn.execute("DELETE FROM application_stats")
+    conn.executemany(
+        "INSERT INTO application_stats (kind, key, count) VALUES (?, ?, ?)",
+        [(kind, key, count) for (kind, key), count in _count_stats_from_records(conn).items()]
+    )
+    conn.execute(
+        "INSERT OR REPLACE INTO store_meta (key, value) VALUES ('stats_built', ?)",
+        (datetime.now().isoformat(),)
+    )
+
+
 def get_application_stats() -> dict:
     """
     Get statistics about applications.
     
+    Reads the materialized counters; no records are scanned.
+    
     Returns:
         dict: Application statistics
     """
-    jobs = load_applied_jobs()
+    conn = get_connection()
     
     stats = {
-        "total_applied": len(jobs),
+        "total_applied": 0,
         "by_status": {},
         "by_portal": {},
         "today": 0
@@ -118,23 +456,56 @@ def get_application_stats() -> dict:
     
     today = datetime.now().date().isoformat()
     
-    for job in jobs:
-        # Count by status
-        status = job.get("status", "UNKNOWN")
-        stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-        
-        # Count by portal
-        portal = job.get("portal", "Unknown")
-        stats["by_portal"][portal] = stats["by_portal"].get(portal, 0) + 1
-        
-        # Count today's applications
-        applied_at = job.get("applied_at", "")
-        if applied_at.startswith(today):
-            stats["today"] += 1
+    for kind, key, count in conn.execute(
+        "SELECT kind, key, count FROM application_stats "
+        "WHERE kind IN ('total', 'status', 'portal') OR (kind = 'day' AND key = ?) "
+        "ORDER BY id",
+        (today,)
+    ):
+        if kind == "total":
+            stats["total_applied"] = count
+        elif kind == "status":
+            stats["by_status"][key] = count
+        elif kind == "portal":
+            stats["by_portal"][key] = count
+        else:
+            stats["today"] = count
     
     return stats
 
 
+def verify_application_stats(rebuild: bool = False) -> list:
+    """
+    Recompute statistics from scratch and compare with the counters.
+    
+    Args:
+        rebuild: Replace the counters with the recomputed values
+    
+    Returns:
+        list: Drift entries (kind, key, stored, actual); empty if in sync
+    """
+    conn = get_connection()
+    
+    stored = {
+        (kind, key): count
+        for kind, key, count in conn.execute("SELECT kind, key, count FROM application_stats")
+    }
+    actual = _count_stats_from_records(conn)
+    
+    drift = []
+    for kind_key in list(actual) + [k for k in stored if k not in actual]:
+        stored_count = stored.get(kind_key, 0)
+        actual_count = actual.get(kind_key, 0)
+        if stored_count != actual_count:
+            drift.append((kind_key[0], kind_key[1], stored_count, actual_count))
+    
+    if rebuild:
+        with conn:
+            _rebuild_stats(conn)
+    
+    return drift
+
+
 def print_application_summary():
     """
     Print a summary of applications.
@@ -158,3 +529,29 @@ def print_application_summary():
             print(f"      {portal}: {count}")
     
     print("=" * 40)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Application store maintenance")
+    parser.add_argument("--verify-stats", action="store_true",
+                        help="Recompute statistics from records and report drift")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="With --verify-stats: overwrite counters with recomputed values")
+    args = parser.parse_args()
+    
+    if args.verify_stats:
+        drift = verify_application_stats(rebuild=args.rebuild)
+        if not drift:
+            print("✅ Application stats are in sync with records")
+        else:
+            print(f"⚠️ {len(drift)} counters drifted:")
+            for kind, key, stored, actual in drift:
+                print(f"   {kind}:{key or '-'} stored={stored} actual={actual}")
+            if args.rebuild:
+                print("🔧 Counters rebuilt from records")
+    
+    print_application_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Seen-Jobs Filter Module
+
+Answers "have we ever read or evaluated this job before?" across the
+whole job history without touching the database for new jobs.
+
+A persistent, memory-mapped Bloom filter (data/seen_jobs.bloom) sits in
+front of the exact seen_jobs table in app_logging/memory.py:
+- a Bloom miss means the job key is definitely new
+- a Bloom hit falls through to the exact store to rule out
+  false positives
+
+The filter is a fixed-size bit array (a few MB for millions of keys),
+so lookup cost stays constant regardless of history size.
+"""
+
+import atexit
+import hashlib
+import math
+import mmap
+import struct
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app_logging.memory import is_job_seen, mark_jobs_seen, iter_seen_job_keys
+from portals.job_key import job_identity
+
+SEEN_FILTER_FILE = Path(__file__).parent.parent / "data" / "seen_jobs.bloom"
+
+DEFAULT_CAPACITY = 2_000_000   # Expected number of job keys
+DEFAULT_ERROR_RATE = 0.01      # False-positive rate at capacity (~2.4 MB)
+
+# Header: magic, version, bit count, hash count, item count
+HEADER = struct.Struct("<4sIQIQ")
+MAGIC = b"JBLM"
+VERSION = 1
+
+
+class BloomFilter:
+    """
+    Bloom filter over a memory-mapped file.
+    
+    Uses double hashing over a single BLAKE2b digest to derive the
+    bit positions for each key.
+    """
+    
+    def __init__(self, path: Path, capacity: int = DEFAULT_CAPACITY,
+                 error_rate: float = DEFAULT_ERROR_RATE):
+        self.path = Path(path)
+        self.created = not self.path.exists()
+        
+        if self.created:
+            num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+            num_bits = (num_bits + 7) // 8 * 8
+            num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, num_bits, num_hashes, 0))
+                f.truncate(HEADER.size + num_bits // 8)
+        
+        self._file = open(self.path, "r+b")
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        
+        magic, version, num_bits, num_hashes, count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mmap.close()
+            self._file.close()
+            raise ValueError(f"Not a seen-jobs filter file: {self.path}")
+        
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.count = count
+        self.capacity = capacity
+    
+    def _positions(self, key: str):
+        """Yield the bit positions for a key."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1, h2 = struct.unpack("<QQ", digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, key: str) -> bool:
+        """
+        Add a key to the filter.
+        
+        Returns:
+            bool: True if the key was (probably) not present before
+        """
+        added = False
+        for pos in self._positions(key):
+            offset = HEADER.size + (pos >> 3)
+            mask = 1 << (pos & 7)
+            byte = self._mmap[offset]
+            if not byte & mask:
+                self._mmap[offset] = byte | mask
+                added = True
+        
+        if added:
+            self.count += 1
+        return added
+    
+    def __contains__(self, key: str) -> bool:
+        for pos in self._positions(key):
+            if not self._mmap[HEADER.size + (pos >> 3)] & (1 << (pos & 7)):
+                return False
+        return True
+    
+    def flush(self):
+        """Write the header and flush dirty pages to disk."""
+        HEADER.pack_into(self._mmap, 0, MAGIC, VERSION, self.num_bits, self.num_hashes, self.count)
+        self._mmap.flush()
+    
+    def close(self):
+        """Flush and unmap the filter."""
+        if self._mmap is not None:
+            self.flush()
+            self._mmap.close()
+            self._mmap = None
+            self._file.close()
+
+
+_filter = None
+
+
+def get_seen_filter() -> BloomFilter:
+    """
+    Open (once per process) the seen-jobs filter.
+    
+    A new filter file is seeded from the exact seen store, so deleting
+    data/seen_jobs.bloom is a safe way to rebuild it.
+    
+    Returns:
+        BloomFilter: Shared filter instance
+    """
+    global _filter
+    
+    if _filter is None:
+        bloom = BloomFilter(SEEN_FILTER_FILE)
+        if bloom.created:
+            for job_key in iter_seen_job_keys():
+                bloom.add(job_key)
+            bloom.flush()
+        _filter = bloom
+        atexit.register(bloom.close)
+    
+    return _filter
+
+
+def was_seen(job_url: str) -> bool:
+    """
+    Check if a job was ever read or evaluated.
+    
+    Args:
+        job_url: URL of the job
+    
+    Returns:
+        bool: True if the job has been seen before
+    """
+    if job_identity(job_url) not in get_seen_filter():
+        return False
+    return is_job_seen(job_url)
+
+
+def mark_seen(job_urls, stage: str = "read") -> int:
+    """
+    Record one or more jobs as seen in both the filter and the exact store.
+    
+    Args:
+        job_urls: A job URL or a list of job URLs
+        stage: Pipeline stage that saw them
+    
+    Returns:
+        int: Number of job keys that were new to the exact store
+    """
+    if isinstance(job_urls, str):
+        job_urls = [job_urls]
+    
+    bloom = get_seen_filter()
+    for url in job_urls:
+        if url:
+            bloom.add(job_identity(url))
+    
+    return mark_jobs_seen(job_urls, stage)
@@ -0,0 +1,95 @@
+"""
+Application Store Test - SQLite history in app_logging/memory.py
+
+Runs against a scratch database and legacy JSON file under tmp_path.
+
+Usage:
+    python -m pytest app_logging/test_memory_store.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app_logging import memory
+
+
+def _url(number: int, tracking: str = "") -> str:
+    return f"https://www.indeed.com/viewjob?jk={number:016x}{tracking}"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """app_logging/memory.py pointed at files under tmp_path."""
+    memory.close_connection()
+    monkeypatch.setattr(memory, "APPLIED_JOBS_FILE", tmp_path / "applied_jobs.json")
+    monkeypatch.setattr(memory, "APPLIED_JOBS_DB", tmp_path / "applied_jobs.db")
+    yield memory
+    memory.close_connection()
+
+
+def test_json_history_imported_once(store):
+    store.APPLIED_JOBS_FILE.write_text(json.dumps([
+        {"url": _url(1), "applied_at": "2024-01-02T10:00:00", "status": "APPLIED", "portal": "Indeed"},
+        {"url": _url(2, "&from=serp"), "applied_at": "2024-01-03T10:00:00", "status": "FAILED",
+         "portal": "Indeed", "job_title": "ML Engineer"},
+        {"status": "APPLIED"},   # No URL: skipped
+    ]), encoding="utf-8")
+
+    assert store.is_job_applied(_url(1))
+    assert store.is_job_applied(_url(2))   # Matched by job key, without tracking
+    assert not store.is_job_applied(_url(3))
+    records = store.load_applied_jobs()
+    assert [record["url"] for record in records] == [_url(1), _url(2, "&from=serp")]
+    assert records[1]["job_title"] == "ML Engineer"
+
+    # Imported once: the JSON file is not read again
+    assert store.import_json_history() == 0
+    store.close_connection()
+    store.APPLIED_JOBS_FILE.write_text(json.dumps([{"url": _url(5)}]), encoding="utf-8")
+    assert not store.is_job_applied(_url(5))
+    assert len(store.load_applied_jobs()) == 2
+
+
+def test_url_list_history_imported(store):
+    """The {"applied_jobs": [url, ...]} document of memory/memory.py."""
+    store.APPLIED_JOBS_FILE.write_text(json.dumps({"applied_jobs": [_url(1), _url(2)]}),
+                                       encoding="utf-8")
+    assert store.is_job_applied(_url(2, "&vjs=3"))
+    assert store.get_application_stats()["by_status"] == {"APPLIED": 2}
+
+
+def test_mark_job_applied(store):
+    store.mark_job_applied(_url(7, "&tk=x"), {"job_title": "Data Scientist", "company": "Acme"})
+    assert store.is_job_applied(_url(7))
+    record = store.load_applied_jobs()[0]
+    assert record["job_key"] and record["company"] == "Acme"
+
+
+def test_stats_counters_and_drift(store):
+    store.mark_job_applied(_url(1))
+    store.mark_job_applied(_url(2), status="FAILED")
+    store.mark_job_applied(_url(3))
+    stats = store.get_application_stats()
+    assert stats == {"total_applied": 3, "by_status": {"APPLIED": 2, "FAILED": 1},
+                     "by_portal": {"Indeed": 3}, "today": 3}
+    assert store.verify_application_stats() == []
+
+    # Records changed behind the counters' back
+    conn = store.get_connection()
+    with conn:
+        conn.execute("DELETE FROM applied_jobs WHERE status = 'FAILED'")
+    drift = store.verify_application_stats()
+    assert ("total", "", 3, 2) in drift
+    assert ("status", "FAILED", 1, 0) in drift
+    assert store.get_application_stats()["total_applied"] == 3   # Reporting only
+
+    assert store.verify_application_stats(rebuild=True)
+    assert store.verify_application_stats() == []
+    assert store.get_application_stats()["by_status"] == {"APPLIED": 2}
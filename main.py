@@ -3,10 +3,11 @@ Job Auto Apply Agent - Main Entry Point
 Day 5: Config, Preferences & Agent Memory
 """
 
-from resume.parser import extract_resume_text, build_resume_profile
+from resume.profile_cache import load_resume_profile
 from config.loader import load_settings
 from memory.memory import load_memory
 import json
+from pathlib import Path
 
 
 def main():
@@ -22,14 +23,13 @@ def main():
     
     # Extract resume profile
     print("\n📄 Loading resume...")
-    text = extract_resume_text("resume/resume.pdf")
-    profile = build_resume_profile(text)
+    profile, cached = load_resume_profile(Path("resume/resume.pdf"))
 
     # Save profile to file
     with open("data/resume_profile.json", "w", encoding="utf-8") as f:
         json.dump(profile, f, indent=2)
     
-    print("✅ Resume loaded successfully")
+    print(f"✅ Resume loaded successfully{' (cached)' if cached else ''}")
     
     # Display agent status
     print("\n" + "=" * 50)
@@ -0,0 +1,163 @@
+"""
+Near-Duplicate Detection - MinHash signatures with an LSH index
+
+The same role is often reposted by agencies or for several locations
+with an almost identical description. Exact job keys cannot catch that,
+so each description is reduced to a compact MinHash signature:
+- the text is split into word shingles (runs of SHINGLE_SIZE tokens)
+- every shingle is hashed once, then NUM_HASHES hash functions are
+  applied with vectorized NumPy arithmetic and the minimum kept
+
+Two signatures agree in a position with probability equal to the
+Jaccard similarity of the shingle sets. The LSH index splits signatures
+into bands; jobs sharing any band become candidates and are confirmed
+by their estimated similarity. An optional group (e.g. the normalized
+job title) partitions the index: jobs only cluster within their group.
+"""
+
+import hashlib
+import numpy as np
+
+from matching.skill_matcher import tokenize
+
+SHINGLE_SIZE = 5
+NUM_HASHES = 128
+BANDS = 16                  # 16 bands x 8 rows: candidates from ~0.7 similarity
+DEFAULT_THRESHOLD = 0.8     # Estimated Jaccard similarity to count as duplicate
+
+# Multiply-shift hash family, fixed so signatures are stable across runs
+_rng = np.random.default_rng(20240611)
+_MULTIPLIERS = _rng.integers(1, 2**63, NUM_HASHES, dtype=np.uint64) | np.uint64(1)
+_OFFSETS = _rng.integers(0, 2**63, NUM_HASHES, dtype=np.uint64)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """
+    Word shingles of a text.
+
+    Args:
+        text: Job description (plain text, e.g. from clean_job_text)
+        size: Tokens per shingle
+
+    Returns:
+        Set of shingle strings (the whole text if shorter than size)
+    """
+    tokens = tokenize(text or "")
+    if len(tokens) <= size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def minhash_signature(text: str):
+    """
+    MinHash signature of a text's shingles.
+
+    Args:
+        text: Job description
+
+    Returns:
+        Array of NUM_HASHES uint32 values, or None for an empty text
+    """
+    values = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+         for shingle in shingles(text)),
+        dtype=np.uint64
+    )
+    if not len(values):
+        return None
+
+    # (a * x + b) mod 2^64, top 32 bits; wraparound is the modulus
+    hashed = (values[:, None] * _MULTIPLIERS + _OFFSETS) >> np.uint64(32)
+    return hashed.min(axis=0).astype(np.uint32)
+
+
+def estimated_similarity(a: np.ndarray, b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+class NearDuplicateIndex:
+    """
+    LSH index of cluster representatives.
+
+    Jobs are offered in order; the first job of each cluster becomes its
+    representative, later near-identical jobs are reported as members.
+
+    Usage:
+        index = NearDuplicateIndex()
+        rep = index.add(url, description)   # None if url is a new representative
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, bands: int = BANDS):
+        self.threshold = threshold
+        self.bands = bands
+        self._rows = NUM_HASHES // bands
+        self._buckets = [{} for _ in range(bands)]   # band -> {band bytes: [rep ids]}
+        self._signatures = {}                         # rep id -> signature
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_keys(self, signature: np.ndarray, group: str = "") -> list:
+        """Split a signature into one hashable key per band, within a group."""
+        rows = self._rows
+        prefix = group.encode("utf-8") + b"\0"
+        return [prefix + signature[i * rows:(i + 1) * rows].tobytes() for i in range(self.bands)]
+
+    def find(self, signature: np.ndarray, group: str = ""):
+        """
+        Find the most similar representative above the threshold.
+
+        Args:
+            signature: MinHash signature
+            group: Only representatives added with the same group match
+
+        Returns:
+            Representative id, or None
+        """
+        candidates = set()
+        for bucket, key in zip(self._buckets, self._band_keys(signature, group)):
+            candidates.update(bucket.get(key, ()))
+
+        best, best_similarity = None, self.threshold
+        for rep_id in candidates:
+            similarity = estimated_similarity(signature, self._signatures[rep_id])
+            if similarity >= best_similarity:
+                best, best_similarity = rep_id, similarity
+        return best
+
+    def add(self, doc_id, text: str, group: str = ""):
+        """
+        Offer a job to the index.
+
+        Args:
+            doc_id: Identifier of the job (e.g. its URL)
+            text: Job description
+            group: Partition to cluster within (e.g. the normalized title)
+
+        Returns:
+            Id of the representative this job duplicates, or None if the
+            job was added as a new representative
+        """
+        signature = minhash_signature(text)
+        if signature is None:
+            # Empty descriptions are never duplicates of anything
+            return None
+        return self.add_signature(doc_id, signature, group)
+
+    def add_signature(self, doc_id, signature: np.ndarray, group: str = ""):
+        """
+        Offer a job by its precomputed signature (see add()).
+
+        Lets the signatures be computed elsewhere, e.g. in worker
+        processes, while the index itself stays in one process. The
+        signature must not be None (empty text is never a duplicate).
+        """
+        rep_id = self.find(signature, group)
+        if rep_id is not None:
+            return rep_id
+
+        self._signatures[doc_id] = signature
+        for bucket, key in zip(self._buckets, self._band_keys(signature, group)):
+            bucket.setdefault(key, []).append(doc_id)
+        return None
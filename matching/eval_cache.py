@@ -0,0 +1,205 @@
+"""
+Evaluation Cache - Content-addressed store of job decisions
+
+Each decision is cached under a key made from:
+- the job content hash (description + title + location + company)
+- the resume profile fingerprint (fields the evaluator reads)
+- the settings fingerprint (job, experience and filters sections)
+- the evaluator variant (mode and filter order)
+- the skills index version (master list and skill variants)
+
+Unchanged jobs are served from the cache on the next run; only new or
+changed inputs are evaluated. Changing the resume or the relevant
+settings changes every key, so stale decisions are never served.
+
+The cache is a SQLite database (data/evaluation_cache.db) bounded to
+max_entries with least-recently-used eviction.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+from matching.skills_index import get_skills_index
+
+EVAL_CACHE_DB = Path("data/evaluation_cache.db")
+
+# Bump when evaluator logic changes in a way that alters decisions
+CACHE_VERSION = 5
+
+DEFAULT_MAX_ENTRIES = 200_000
+
+# Stay well under SQLite's bound-parameter limit
+QUERY_BATCH = 500
+
+RESUME_FIELDS = ("skills", "experience_years", "location")
+SETTINGS_SECTIONS = ("job", "experience", "filters")
+
+
+def _digest(*parts: str) -> str:
+    """SHA-256 hex digest of NUL-joined string parts."""
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def job_content_hash(job: dict) -> str:
+    """
+    Hash the job fields that evaluation depends on.
+
+    Args:
+        job: Job profile dictionary
+
+    Returns:
+        Hex digest of description + title + location + company
+        (normalized like the company block list)
+    """
+    return _digest(
+        job.get("description") or "",
+        job.get("job_title") or "",
+        job.get("location") or "",
+        (job.get("company") or "").strip().lower()
+    )
+
+
+def context_fingerprint(resume: dict, settings: dict, variant: str = "") -> str:
+    """
+    Fingerprint the resume and settings inputs of an evaluation.
+
+    Args:
+        resume: Resume profile dictionary
+        settings: Configuration settings
+        variant: Evaluator variant (JobEvaluator.variant)
+
+    Returns:
+        Hex digest covering the evaluator-relevant resume fields,
+        settings sections and the skills index version
+    """
+    resume_part = {field: resume.get(field) for field in RESUME_FIELDS}
+    settings_part = {section: settings.get(section) for section in SETTINGS_SECTIONS}
+    return _digest(
+        str(CACHE_VERSION),
+        variant,
+        get_skills_index().version,
+        json.dumps(resume_part, sort_keys=True, ensure_ascii=False),
+        json.dumps(settings_part, sort_keys=True, ensure_ascii=False)
+    )
+
+
+class EvaluationCache:
+    """
+    Persistent, size-bounded LRU cache of evaluation decisions.
+
+    Usage:
+        cache = EvaluationCache(resume, settings, evaluator.variant)
+        cached = cache.get_many(jobs)       # {index: decision}
+        cache.put_many(new_jobs, decisions)
+        cache.close()                       # evicts and commits
+    """
+
+    def __init__(self, resume: dict, settings: dict, variant: str = "",
+                 path: Path = EVAL_CACHE_DB, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.context = context_fingerprint(resume, settings, variant)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS eval_cache ("
+            "key TEXT PRIMARY KEY, decision TEXT NOT NULL, last_used REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_eval_cache_last_used ON eval_cache(last_used)"
+        )
+
+    def key_for(self, job: dict) -> str:
+        """Cache key for a job under this resume/settings context."""
+        return _digest(self.context, job_content_hash(job))
+
+    def get_many(self, jobs: list) -> dict:
+        """
+        Look up cached decisions for a list of jobs.
+
+        Args:
+            jobs: List of job profile dictionaries
+
+        Returns:
+            dict: {position in jobs: decision} for every cache hit
+        """
+        keys = [self.key_for(job) for job in jobs]
+        found = {}
+
+        for start in range(0, len(keys), QUERY_BATCH):
+            batch = keys[start:start + QUERY_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            for key, decision in self.conn.execute(
+                f"SELECT key, decision FROM eval_cache WHERE key IN ({placeholders})", batch
+            ):
+                found[key] = decision
+
+        # Refresh recency of everything we served
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE eval_cache SET last_used = ? WHERE key = ?",
+                [(now, key) for key in found]
+            )
+
+        hits = {i: json.loads(found[key]) for i, key in enumerate(keys) if key in found}
+        self.hits += len(hits)
+        self.misses += len(jobs) - len(hits)
+        return hits
+
+    def put_many(self, jobs: list, decisions: list):
+        """
+        Store decisions for a list of jobs.
+
+        Args:
+            jobs: List of job profile dictionaries
+            decisions: Decision dictionaries, same order as jobs
+        """
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO eval_cache (key, decision, last_used) VALUES (?, ?, ?)",
+                [
+                    (self.key_for(job), json.dumps(decision, ensure_ascii=False), now)
+                    for job, decision in zip(jobs, decisions)
+                ]
+            )
+
+    def evict(self) -> int:
+        """
+        Drop least-recently-used entries beyond max_entries.
+
+        Returns:
+            int: Number of entries evicted
+        """
+        count = self.conn.execute("SELECT COUNT(*) FROM eval_cache").fetchone()[0]
+        excess = count - self.max_entries
+        if excess <= 0:
+            return 0
+
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM eval_cache WHERE key IN ("
+                "SELECT key FROM eval_cache ORDER BY last_used LIMIT ?)",
+                (excess,)
+            )
+        return excess
+
+    def close(self) -> int:
+        """
+        Evict over-limit entries and close the database.
+
+        Returns:
+            int: Number of entries evicted
+        """
+        evicted = self.evict()
+        self.conn.close()
+        return evicted
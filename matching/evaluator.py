@@ -3,10 +3,17 @@ Job Matching & Evaluation Engine - The brain that decides Apply or Skip
 """
 
 import re
-from rapidfuzz import fuzz
+import time
+import numpy as np
+from rapidfuzz import fuzz, process
 
+from matching.skill_matcher import normalize_skill
+from matching.skills_index import get_skills_index
 
-def title_similarity(resume_title: str, job_title: str) -> int:
+EXPERIENCE_PATTERN = re.compile(r"(\d+)\+?\s+years")
+
+
+def title_similarity(resume_title: str, job_title: str) -> float:
     """
     Calculate similarity between resume target title and job title.
     
@@ -18,7 +25,7 @@ def title_similarity(resume_title: str, job_title: str) -> int:
         Similarity score (0-100)
     """
     if not resume_title or not job_title:
-        return 0
+        return 0.0
     return fuzz.token_set_ratio(resume_title.lower(), job_title.lower())
 
 
@@ -26,6 +33,9 @@ def skill_overlap(resume_skills: list, job_description: str) -> int:
     """
     Count how many resume skills appear in the job description.
     
+    Uses the shared skills index: one pass over the description,
+    whole-word matches only, variants counted as their canonical skill.
+    
     Args:
         resume_skills: List of skills from resume
         job_description: Full job description text
@@ -33,14 +43,11 @@ def skill_overlap(resume_skills: list, job_description: str) -> int:
     Returns:
         Number of matching skills
     """
-    job_text = job_description.lower()
-    matched = []
-
-    for skill in resume_skills:
-        if skill.lower() in job_text:
-            matched.append(skill)
-
-    return len(set(matched))
+    index = get_skills_index()
+    matcher = index.matcher(tuple(resume_skills))
+    wanted = {index.canonical_key(skill) for skill in resume_skills}
+    found = {normalize_skill(skill) for skill in matcher.find_skills(job_description)}
+    return len(found & wanted)
 
 
 def extract_job_experience(text: str) -> int:
@@ -53,7 +60,7 @@ def extract_job_experience(text: str) -> int:
     Returns:
         Years of experience required (0 if not found)
     """
-    match = re.search(r"(\d+)\+?\s+years", text.lower())
+    match = EXPERIENCE_PATTERN.search(text.lower())
     return int(match.group(1)) if match else 0
 
 
@@ -73,60 +80,360 @@ def location_match(user_location: str, job_location: str) -> bool:
     return user_location.lower() in job_location.lower()
 
 
-def evaluate_job(resume: dict, job: dict, settings: dict) -> dict:
+# Filters in the order they run: cheapest first, by a static estimate of
+# each filter's cost. Location and block-list checks are plain string
+# tests, the title score is one fuzzy match on a short string, experience
+# needs a regex over the full description and the skill scan tokenizes
+# the whole description. JobEvaluator.calibrate() can measure the costs
+# on a sample and reorder an evaluator's pipeline; nothing calls it by
+# default.
+DEFAULT_FILTER_ORDER = ("location", "company", "title", "experience", "skills")
+
+# Order reasons are reported in, independent of evaluation order
+REASON_ORDER = ("title", "skills", "experience", "location", "company")
+
+EVALUATION_MODES = ("fast", "explain")
+
+
+class JobEvaluator:
+    """
+    Evaluator compiled once from a resume profile and settings.
+    
+    Everything that only depends on the resume and settings (normalized
+    target title, skill matcher, thresholds, experience limit, user
+    location, company block list) is prepared in the constructor, so
+    evaluate() and evaluate_many() only do per-job work. Build one per
+    run (or per polling loop) and reuse it for every job.
+    
+    Filters run as a pipeline ordered by cost. In "fast" mode a job
+    stops at its first rejecting filter, so cheap rejections never pay
+    for the fuzzy title score or the skill scan; metrics that were not
+    computed are None. In "explain" mode every filter runs and every
+    reason is reported.
+    """
+    
+    def __init__(self, resume: dict, settings: dict, workers: int = -1,
+                 mode: str = "fast", filter_order: tuple = DEFAULT_FILTER_ORDER):
+        """
+        Args:
+            resume: Resume profile dictionary
+            settings: Configuration settings
+            workers: Threads for batch title scoring (-1 = all cores)
+            mode: "fast" (stop at first rejection) or "explain" (all reasons)
+            filter_order: Order the filters run in
+        """
+        if mode not in EVALUATION_MODES:
+            raise ValueError(f"Unknown evaluation mode: {mode}")
+        
+        self.resume = resume
+        self.settings = settings
+        self.workers = workers
+        self.mode = mode
+        self.filter_order = tuple(filter_order)
+        
+        # Title: normalized once, reused as the fuzzy-match query
+        self.target_title = (settings["job"]["title"] or "").lower()
+        
+        # Skills: compiled matcher plus the canonical resume skill keys
+        skills_index = get_skills_index()
+        self.skill_matcher = skills_index.matcher(tuple(resume["skills"]))
+        self.resume_skill_keys = {skills_index.canonical_key(skill) for skill in resume["skills"]}
+        
+        # Experience
+        self.experience_pattern = EXPERIENCE_PATTERN
+        self.user_experience = resume["experience_years"]
+        self.max_experience = resume["experience_years"] + settings["experience"]["max_extra_years"]
+        
+        # Location
+        self.user_location = resume["location"]
+        self.user_location_lower = resume["location"].lower()
+        
+        # Thresholds
+        self.min_title_match = settings["filters"]["min_title_match"]
+        self.min_skill_match = settings["filters"]["min_skill_match"]
+        
+        # Company block list
+        self.blocked_companies = {
+            company.strip().lower()
+            for company in settings["filters"].get("blocked_companies") or []
+        }
+        
+        # name -> (per-job check, batch check)
+        self._filters = {
+            "location": (self._check_location, self._batch_location),
+            "company": (self._check_company, self._batch_company),
+            "title": (self._check_title, self._batch_title),
+            "experience": (self._check_experience, self._batch_experience),
+            "skills": (self._check_skills, self._batch_skills),
+        }
+    
+    @property
+    def variant(self) -> str:
+        """Identifies mode and filter order (they shape fast-mode output)."""
+        return f"{self.mode}:{','.join(self.filter_order)}"
+    
+    def title_score(self, job_title: str):
+        """Fuzzy score of a job title against the target title (0-100)."""
+        if not self.target_title or not job_title:
+            return 0.0
+        return fuzz.token_set_ratio(self.target_title, job_title.lower())
+    
+    def skill_count(self, description: str) -> int:
+        """Number of distinct resume skills found in a description."""
+        found = {normalize_skill(skill) for skill in self.skill_matcher.find_skills(description)}
+        return len(found & self.resume_skill_keys)
+    
+    def job_experience(self, description_lower: str) -> int:
+        """Years of experience required, from already-lowercased text."""
+        match = self.experience_pattern.search(description_lower)
+        return int(match.group(1)) if match else 0
+    
+    def location_ok(self, job_location: str) -> bool:
+        """True if the job is remote or in the user's location."""
+        job_location = job_location.lower()
+        return "remote" in job_location or self.user_location_lower in job_location
+    
+    def company_blocked(self, company: str) -> bool:
+        """True if the company is on the block list."""
+        return bool(self.blocked_companies) and (company or "").strip().lower() in self.blocked_companies
+    
+    # ---------- Per-job filters: store the metric, return True if rejected ----------
+    
+    def _check_location(self, job: dict, metrics: dict) -> bool:
+        return not self.location_ok(job["location"])
+    
+    def _check_company(self, job: dict, metrics: dict) -> bool:
+        return self.company_blocked(job.get("company"))
+    
+    def _check_title(self, job: dict, metrics: dict) -> bool:
+        metrics["title_match"] = self.title_score(job["job_title"])
+        return metrics["title_match"] < self.min_title_match
+    
+    def _check_experience(self, job: dict, metrics: dict) -> bool:
+        metrics["job_experience"] = self.job_experience(job["description"].lower())
+        return metrics["job_experience"] > self.max_experience
+    
+    def _check_skills(self, job: dict, metrics: dict) -> bool:
+        metrics["skill_match"] = self.skill_count(job["description"])
+        return metrics["skill_match"] < self.min_skill_match
+    
+    def _reason(self, name: str, job: dict, metrics: dict) -> str:
+        """Reason text for a rejecting filter."""
+        if name == "title":
+            return f"Low title match ({metrics['title_match']}% < {self.min_title_match}%)"
+        if name == "skills":
+            return f"Insufficient skill match ({metrics['skill_match']} < {self.min_skill_match})"
+        if name == "experience":
+            return f"Experience exceeds limit ({metrics['job_experience']} years > {self.max_experience} years)"
+        if name == "location":
+            return f"Location mismatch ({self.user_location} vs {job['location']})"
+        return f"Blocked company ({job.get('company')})"
+    
+    # ---------- Batch filters: metric for jobs[idx], return failure mask ----------
+    
+    def _batch_location(self, jobs: list, idx, metrics: dict):
+        ok = np.fromiter((self.location_ok(jobs[i]["location"]) for i in idx), dtype=bool, count=len(idx))
+        return ~ok
+    
+    def _batch_company(self, jobs: list, idx, metrics: dict):
+        return np.fromiter(
+            (self.company_blocked(jobs[i].get("company")) for i in idx), dtype=bool, count=len(idx)
+        )
+    
+    def _batch_title(self, jobs: list, idx, metrics: dict):
+        titles = [(jobs[i]["job_title"] or "").lower() for i in idx]
+        if self.target_title and titles:
+            # All titles in one call, spread over worker threads
+            scores = process.cdist(
+                [self.target_title], titles,
+                scorer=fuzz.token_set_ratio, dtype=np.float64, workers=self.workers
+            )[0]
+            scores[np.array([not title for title in titles])] = 0
+        else:
+            scores = np.zeros(len(idx))
+        metrics["title_match"][idx] = scores
+        return scores < self.min_title_match
+    
+    def _batch_experience(self, jobs: list, idx, metrics: dict):
+        years = np.fromiter(
+            (self.job_experience(jobs[i]["description"].lower()) for i in idx),
+            dtype=np.int64, count=len(idx)
+        )
+        metrics["job_experience"][idx] = years
+        return years > self.max_experience
+    
+    def _batch_skills(self, jobs: list, idx, metrics: dict):
+        counts = np.fromiter(
+            (self.skill_count(jobs[i]["description"]) for i in idx),
+            dtype=np.int64, count=len(idx)
+        )
+        metrics["skill_match"][idx] = counts
+        return counts < self.min_skill_match
+    
+    # ---------- Evaluation ----------
+    
+    def evaluate(self, job: dict) -> dict:
+        """
+        Decide whether to apply or skip one job.
+        
+        Args:
+            job: Job profile dictionary
+            
+        Returns:
+            Decision dictionary with scores and reasoning
+        """
+        explain = self.mode == "explain"
+        metrics = {"title_match": None, "skill_match": None, "job_experience": None}
+        failed = []
+        
+        for name in self.filter_order:
+            if self._filters[name][0](job, metrics):
+                failed.append(name)
+                if not explain:
+                    break
+        
+        return self._decision(job, metrics, failed)
+    
+    def evaluate_many(self, jobs: list) -> list:
+        """
+        Decide apply or skip for many jobs at once.
+        
+        Each filter runs over all remaining jobs at once (title scores
+        in one rapidfuzz cdist call, metrics in NumPy arrays, thresholds
+        as masks). In fast mode rejected jobs drop out before the next,
+        more expensive filter. Decision dictionaries are only built at
+        the end and are identical to what evaluate() returns.
+        
+        Args:
+            jobs: List of job profile dictionaries
+            
+        Returns:
+            List of decision dictionaries, in the same order as jobs
+        """
+        if not jobs:
+            return []
+        
+        count = len(jobs)
+        explain = self.mode == "explain"
+        alive = np.ones(count, dtype=bool)
+        metrics = {
+            "title_match": np.full(count, np.nan),
+            "job_experience": np.full(count, np.nan),
+            "skill_match": np.full(count, np.nan),
+        }
+        failures = {}
+        
+        for name in self.filter_order:
+            idx = np.flatnonzero(alive)
+            if not len(idx):
+                break
+            failed = self._filters[name][1](jobs, idx, metrics)
+            failures[name] = np.zeros(count, dtype=bool)
+            failures[name][idx[failed]] = True
+            if not explain:
+                alive[idx[failed]] = False
+        
+        decisions = []
+        for i, job in enumerate(jobs):
+            job_metrics = {
+                "title_match": _metric(metrics["title_match"][i], float),
+                "skill_match": _metric(metrics["skill_match"][i], int),
+                "job_experience": _metric(metrics["job_experience"][i], int),
+            }
+            failed = [name for name, failed_mask in failures.items() if failed_mask[i]]
+            decisions.append(self._decision(job, job_metrics, failed))
+        
+        return decisions
+    
+    def calibrate(self, sample_jobs: list) -> dict:
+        """
+        Measure each filter on a sample and reorder the pipeline cheapest first.
+        
+        Args:
+            sample_jobs: Representative job profiles
+            
+        Returns:
+            dict: Seconds per job for each filter
+        """
+        idx = np.arange(len(sample_jobs))
+        costs = {}
+        for name, (_, batch_check) in self._filters.items():
+            metrics = {key: np.full(len(sample_jobs), np.nan)
+                       for key in ("title_match", "job_experience", "skill_match")}
+            start = time.perf_counter()
+            batch_check(sample_jobs, idx, metrics)
+            costs[name] = (time.perf_counter() - start) / max(len(sample_jobs), 1)
+        
+        self.filter_order = tuple(sorted(self._filters, key=costs.get))
+        return costs
+    
+    def _decision(self, job: dict, metrics: dict, failed: list) -> dict:
+        """Build the decision dictionary from metrics and rejecting filters."""
+        decision = {
+            "title_match": metrics["title_match"],
+            "skill_match": metrics["skill_match"],
+            "job_experience": metrics["job_experience"],
+            "user_experience": self.user_experience,
+            "max_allowed_experience": self.max_experience,
+            "decision": "SKIP",
+            "reasons": [self._reason(name, job, metrics) for name in REASON_ORDER if name in failed]
+        }
+        
+        # Final decision
+        if not decision["reasons"]:
+            decision["decision"] = "APPLY"
+            decision["reasons"] = ["All criteria met"]
+        
+        return decision
+
+
+def _metric(value, cast):
+    """Convert a NumPy metric cell to a Python value (None if not computed)."""
+    return None if np.isnan(value) else cast(value)
+
+
+def evaluate_job(resume: dict, job: dict, settings: dict, mode: str = "fast") -> dict:
     """
     Main evaluation function - decides whether to apply or skip.
     
+    For many jobs, build a JobEvaluator once and reuse it instead.
+    
     Args:
         resume: Resume profile dictionary
         job: Job profile dictionary
         settings: Configuration settings
+        mode: "fast" (stop at first rejection) or "explain" (all reasons)
         
     Returns:
         Decision dictionary with scores and reasoning
     """
-    # Calculate metrics
-    score = title_similarity(settings["job"]["title"], job["job_title"])
-    skills = skill_overlap(resume["skills"], job["description"])
-    job_exp = extract_job_experience(job["description"])
-    max_exp = resume["experience_years"] + settings["experience"]["max_extra_years"]
-
-    # Initialize decision object
-    decision = {
-        "title_match": score,
-        "skill_match": skills,
-        "job_experience": job_exp,
-        "user_experience": resume["experience_years"],
-        "max_allowed_experience": max_exp,
-        "decision": "SKIP",
-        "reasons": []
-    }
+    return JobEvaluator(resume, settings, mode=mode).evaluate(job)
 
-    # Apply filters
-    if score < settings["filters"]["min_title_match"]:
-        decision["reasons"].append(f"Low title match ({score}% < {settings['filters']['min_title_match']}%)")
 
-    if skills < settings["filters"]["min_skill_match"]:
-        decision["reasons"].append(f"Insufficient skill match ({skills} < {settings['filters']['min_skill_match']})")
-
-    if job_exp > max_exp:
-        decision["reasons"].append(f"Experience exceeds limit ({job_exp} years > {max_exp} years)")
-
-    if not location_match(resume["location"], job["location"]):
-        decision["reasons"].append(f"Location mismatch ({resume.get('location', 'N/A')} vs {job['location']})")
-
-    # Final decision
-    if not decision["reasons"]:
-        decision["decision"] = "APPLY"
-        decision["reasons"] = ["All criteria met"]
-
-    return decision
+def evaluate_jobs(resume: dict, jobs: list, settings: dict, workers: int = -1,
+                  mode: str = "fast") -> list:
+    """
+    Batch evaluation - decides apply or skip for many jobs at once.
+    
+    Args:
+        resume: Resume profile dictionary
+        jobs: List of job profile dictionaries
+        settings: Configuration settings
+        workers: Threads for title scoring (-1 = all cores)
+        mode: "fast" (stop at first rejection) or "explain" (all reasons)
+        
+    Returns:
+        List of decision dictionaries, in the same order as jobs
+    """
+    return JobEvaluator(resume, settings, workers, mode).evaluate_many(jobs)
 
 
 def get_match_summary(decision: dict) -> str:
     """
     Get a human-readable summary of the matching decision.
     
+    Use mode="explain" when evaluating to get every reason.
+    
     Args:
         decision: Decision dictionary from evaluate_job
         
@@ -135,10 +442,15 @@ def get_match_summary(decision: dict) -> str:
     """
     emoji = "✅" if decision["decision"] == "APPLY" else "❌"
     
+    # Metrics skipped by a fast-mode evaluation are None
+    title_match = "n/a" if decision["title_match"] is None else f"{decision['title_match']}%"
+    skill_match = "n/a" if decision["skill_match"] is None else f"{decision['skill_match']} skills"
+    job_experience = "n/a" if decision["job_experience"] is None else f"{decision['job_experience']} years"
+    
     summary = f"{emoji} {decision['decision']}\n"
-    summary += f"Title Match: {decision['title_match']}%\n"
-    summary += f"Skill Match: {decision['skill_match']} skills\n"
-    summary += f"Experience: {decision['job_experience']} years required (you have {decision.get('user_experience', 0)})\n"
+    summary += f"Title Match: {title_match}\n"
+    summary += f"Skill Match: {skill_match}\n"
+    summary += f"Experience: {job_experience} required (you have {decision.get('user_experience', 0)})\n"
     summary += f"\nReasons:\n"
     
     for reason in decision["reasons"]:
@@ -1,137 +1,320 @@
 """
 Job Description Reader - Extracts and cleans job information from HTML
+
+clean_job_text has interchangeable HTML backends that produce identical
+text: selectolax or lxml when installed (C parsers, much faster on full
+job pages), BeautifulSoup's pure-python html.parser otherwise.
 """
 
 import re
+import time
+from functools import cached_property
 from bs4 import BeautifulSoup
 
+from matching.structured_data import extract_structured_job
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:
+    lxml = None
+
+# Tags whose text never appears in the cleaned output
+SKIPPED_TAGS = ("script", "style", "template", "rt", "rp")
+
+# Inputs a fast backend rejects (lxml: empty document, encoding declaration)
+BACKEND_ERRORS = (ValueError,) + ((etree.ParserError,) if lxml else ())
+
+
+def _join_lines(text: str) -> str:
+    """Strip every line and drop blank ones, preserving line breaks."""
+    lines = [line.strip() for line in text.split("\n") if line.strip()]
+    return "\n".join(lines)
+
+
+def _text_bs4(raw_html: str) -> str:
+    """Reference backend: BeautifulSoup with html.parser."""
+    soup = BeautifulSoup(raw_html, "html.parser")
+
+    # Remove scripts and styles
+    for tag in soup(["script", "style"]):
+        tag.decompose()
+
+    # Get text with newlines for block elements to preserve structure
+    return soup.get_text(separator="\n")
 
-def clean_job_text(raw_html: str) -> str:
+
+def _text_selectolax(raw_html: str) -> str:
+    """Fast backend: selectolax (lexbor)."""
+    tree = LexborHTMLParser(raw_html)
+    tree.strip_tags(list(SKIPPED_TAGS))
+    return tree.root.text(separator="\n") if tree.root else ""
+
+
+def _text_lxml(raw_html: str) -> str:
+    """Fast backend: lxml (libxml2)."""
+    root = lxml.html.document_fromstring(raw_html)
+    parts = []
+    skipping = 0   # depth inside a skipped subtree
+    for event, element in etree.iterwalk(root, events=("start", "end", "comment", "pi")):
+        if event == "start":
+            if skipping or element.tag in SKIPPED_TAGS:
+                skipping += 1
+            elif element.text:
+                parts.append(element.text)
+            continue
+        if event in ("comment", "pi"):
+            # Only the text after a comment / processing instruction counts
+            if not skipping and element.tail:
+                parts.append(element.tail)
+            continue
+        if skipping:
+            skipping -= 1
+            if skipping:
+                continue
+        if element.tail and element is not root:
+            parts.append(element.tail)
+    return "\n".join(parts)
+
+
+# Backend name -> (text function, installed?), fastest first
+HTML_BACKENDS = {
+    "selectolax": (_text_selectolax, LexborHTMLParser is not None),
+    "lxml": (_text_lxml, lxml is not None),
+    "bs4": (_text_bs4, True),
+}
+
+
+def available_backends() -> list:
+    """
+    List the installed HTML backends.
+
+    Returns:
+        Backend names, fastest first ("bs4" is always last)
+    """
+    return [name for name, (_, installed) in HTML_BACKENDS.items() if installed]
+
+
+def clean_job_text(raw_html: str, backend: str = None) -> str:
     """
     Converts HTML job description into clean readable text.
     
     Args:
         raw_html: Raw HTML content from job posting
+        backend: HTML backend name (default: fastest installed)
         
     Returns:
         Clean, readable text without HTML tags
     """
-    soup = BeautifulSoup(raw_html, "html.parser")
+    name = backend or available_backends()[0]
+    text_of, installed = HTML_BACKENDS[name]
+    if not installed:
+        raise ImportError(f"HTML backend not installed: {name}")
 
-    # Remove scripts and styles
-    for tag in soup(["script", "style"]):
-        tag.decompose()
+    try:
+        text = text_of(raw_html)
+    except BACKEND_ERRORS:
+        # e.g. lxml rejects empty documents; the reference parser never fails
+        text = _text_bs4(raw_html)
 
-    # Get text with newlines for block elements to preserve structure
-    text = soup.get_text(separator="\n")
-    
     # Clean up excessive whitespace while preserving line breaks
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    text = "\n".join(lines)
+    return _join_lines(text)
+
+
+# Profile fields structured data can supply (description comes as HTML)
+PROFILE_FIELDS = ("job_title", "company", "location", "description_html")
+
+# Lines the title extractor looks at
+HEAD_LINES = 5
+
+# Common job title keywords
+TITLE_KEYWORDS = ("engineer", "developer", "scientist", "analyst", "manager",
+                  "designer", "architect", "consultant", "specialist", "lead")
+TITLE_EXCLUDES = ("looking for", "we are", "experience")
+
+COMPANY_PATTERNS = [
+    re.compile(r"Company[:\-]\s*([A-Z][a-zA-Z0-9 &]+?)(?:\s+Location|$)"),
+    re.compile(r"at\s+([A-Z][a-zA-Z0-9 &]+?)\s+(?:Pvt|Ltd|Inc|in\s|$)"),
+]
+COMPANY_EXCLUDES = ("Location", "Remote", "About", "Requirements", "Experience")
 
-    return text
+# Earlier entries win when several appear in the text
+LOCATIONS = ["Remote", "India", "Bangalore", "Mumbai", "Delhi", "Hyderabad",
+             "Pune", "Chennai", "Kolkata", "Noida", "Gurgaon"]
+_LOCATIONS_LOWER = [(loc, loc.lower()) for loc in LOCATIONS]
 
 
-def extract_job_title(text: str) -> str:
+class JobText:
+    """
+    Job description text prepared once for all extractors.
+
+    Holds the original text, its lowercase form, the line list and the
+    first HEAD_LINES lines, so no extractor re-splits or re-lowercases
+    the whole page. The lowercase form and full line list are computed
+    on first use, the head window with a bounded split.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        # Single-paragraph text has no lines; fall back to sentences
+        self.separator = "\n" if "\n" in text else "."
+        self.head = [line.strip() for line in text.split(self.separator, HEAD_LINES)[:HEAD_LINES]]
+
+    @cached_property
+    def lower(self) -> str:
+        """Lowercase text, computed once."""
+        return self.text.lower()
+
+    @cached_property
+    def lines(self) -> list:
+        """All lines (sentences for single-paragraph text)."""
+        return self.text.split(self.separator)
+
+
+def _job_text(text) -> JobText:
+    """Accept either a JobText or a plain string."""
+    return text if isinstance(text, JobText) else JobText(text)
+
+
+def extract_job_title(text) -> str:
     """
     Extract job title from job description text.
     
     Args:
-        text: Job description text
+        text: Job description text (str or JobText)
         
     Returns:
         Job title or empty string
     """
-    # Try to find common title patterns first
     # Look for lines that are short and appear early in the text
-    lines = text.split("\n") if "\n" in text else text.split(".")
+    head = _job_text(text).head
     
-    # Common job title keywords
-    title_keywords = ["engineer", "developer", "scientist", "analyst", "manager", 
-                     "designer", "architect", "consultant", "specialist", "lead"]
-    
-    for line in lines[:5]:
-        line = line.strip()
+    for line in head:
         # Check if line is reasonable length for a job title (2-8 words)
-        words = line.split()
-        if 2 <= len(words) <= 8:
+        if 2 <= len(line.split()) <= 8:
+            lowered = line.lower()
             # Check if it contains common job title keywords
-            if any(keyword in line.lower() for keyword in title_keywords):
+            if any(keyword in lowered for keyword in TITLE_KEYWORDS):
                 # Exclude lines that are clearly not titles
-                if not any(exclude in line.lower() for exclude in ["looking for", "we are", "experience"]):
+                if not any(exclude in lowered for exclude in TITLE_EXCLUDES):
                     return line
     
     # Fallback: return first short line
-    for line in lines[:3]:
-        line = line.strip()
+    for line in head[:3]:
         if 2 <= len(line.split()) <= 8:
             return line
     
     return ""
 
 
-def extract_company(text: str) -> str:
+def extract_company(text) -> str:
     """
     Extract company name from job description text.
     
     Args:
-        text: Job description text
+        text: Job description text (str or JobText)
         
     Returns:
         Company name or empty string
     """
-    patterns = [
-        r"Company[:\-]\s*([A-Z][a-zA-Z0-9 &]+?)(?:\s+Location|$)",
-        r"at\s+([A-Z][a-zA-Z0-9 &]+?)\s+(?:Pvt|Ltd|Inc|in\s|$)"
-    ]
+    original = _job_text(text).text
 
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in COMPANY_PATTERNS:
+        match = pattern.search(original)
         if match:
             company = match.group(1).strip()
             # Exclude common false positives
-            exclude_words = ["Location", "Remote", "About", "Requirements", "Experience"]
-            if not any(word in company for word in exclude_words):
+            if not any(word in company for word in COMPANY_EXCLUDES):
                 return company
 
     return ""
 
 
-def extract_job_location(text: str) -> str:
+def extract_job_location(text) -> str:
     """
     Extract location from job description text.
     
+    The text is lowercased once (shared via JobText); each candidate is
+    then a plain substring search, in priority order, stopping at the
+    first hit.
+    
     Args:
-        text: Job description text
+        text: Job description text (str or JobText)
         
     Returns:
         Location or empty string
     """
-    locations = ["Remote", "India", "Bangalore", "Mumbai", "Delhi", "Hyderabad", 
-                 "Pune", "Chennai", "Kolkata", "Noida", "Gurgaon"]
+    lowered = _job_text(text).lower
     
-    for loc in locations:
-        if loc.lower() in text.lower():
+    for loc, loc_lower in _LOCATIONS_LOWER:
+        if loc_lower in lowered:
             return loc
     
     return ""
 
 
-def build_job_profile(raw_html: str) -> dict:
+# Text heuristic for each profile field
+PROFILE_EXTRACTORS = {
+    "job_title": extract_job_title,
+    "company": extract_company,
+    "location": extract_job_location,
+}
+
+
+def _timed(timings, stage: str, func, *args):
+    """Call func(*args), adding its wall time to timings[stage] if timings is given."""
+    if timings is None:
+        return func(*args)
+    start = time.perf_counter()
+    result = func(*args)
+    timings[stage] = timings.get(stage, 0.0) + time.perf_counter() - start
+    return result
+
+
+def build_job_profile(raw_html: str, timings: dict = None) -> dict:
     """
     Build a complete job profile from raw HTML.
     
+    Fields from the page's schema.org JobPosting data (JSON-LD or
+    microdata) are used as-is; the text heuristics only fill in what the
+    structured data lacks. Pages without it are handled as before.
+    
     Args:
         raw_html: Raw HTML content from job posting
+        timings: Optional dict; seconds spent per stage (structured_data,
+            clean_text, job_title, company, location) are added to it
         
     Returns:
-        Dictionary containing job_title, company, location, and description
+        Dictionary containing job_title, company, location, description,
+        date_posted, employment_type, salary and structured_fields (the
+        fields taken from structured data)
     """
-    text = clean_job_text(raw_html)
-
-    return {
-        "job_title": extract_job_title(text),
-        "company": extract_company(text),
-        "location": extract_job_location(text),
-        "description": text
+    structured = _timed(timings, "structured_data", extract_structured_job, raw_html)
+    
+    # The whole page is only cleaned if structured data left gaps
+    page_text = None
+    if not all(structured.get(field) for field in PROFILE_FIELDS):
+        page_text = _timed(timings, "clean_text", lambda html: JobText(clean_job_text(html)), raw_html)
+    
+    profile = {
+        field: structured.get(field) or _timed(timings, field, PROFILE_EXTRACTORS[field], page_text)
+        for field in ("job_title", "company", "location")
     }
+    if structured.get("description_html"):
+        profile["description"] = _timed(timings, "clean_text", clean_job_text, structured["description_html"])
+    else:
+        profile["description"] = page_text.text
+    
+    profile["date_posted"] = structured.get("date_posted", "")
+    profile["employment_type"] = structured.get("employment_type", "")
+    profile["salary"] = structured.get("salary")
+    profile["structured_fields"] = [
+        field for field in ("job_title", "company", "location", "description")
+        if structured.get("description_html" if field == "description" else field)
+    ]
+    return profile
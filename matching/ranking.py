@@ -0,0 +1,238 @@
+"""
+Job Ranking - BM25 relevance of job descriptions to the resume
+
+Keeps an in-memory inverted index over job descriptions:
+- a vocabulary mapping each token to a term id
+- postings in compressed sparse row form (one row per job, NumPy arrays
+  of term ids and term counts)
+- document lengths and document frequencies for BM25 normalization
+
+Jobs can be added at any time; new postings are appended and the
+statistics updated in place, so the index is never rebuilt. Scoring a
+query touches every posting once with vectorized NumPy operations.
+"""
+
+import heapq
+import numpy as np
+
+from matching.skill_matcher import tokenize
+
+# BM25 parameters: term-frequency saturation and length normalization
+DEFAULT_K1 = 1.5
+DEFAULT_B = 0.75
+
+# Query weight of resume skill tokens relative to resume text tokens
+SKILL_WEIGHT = 2.0
+
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+    "is", "it", "of", "on", "or", "our", "that", "the", "this", "to", "we",
+    "will", "with", "you", "your",
+})
+
+
+def index_tokens(text: str) -> list:
+    """
+    Tokenize text for the index (skill tokenizer minus stopwords).
+
+    Args:
+        text: Any text
+
+    Returns:
+        List of tokens
+    """
+    return [token for token in tokenize(text or "") if token not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Incremental BM25 index over job descriptions.
+
+    Usage:
+        index = BM25Index()
+        index.add_many(urls, descriptions)
+        scores = index.score(resume_query(resume))   # one score per job
+        index.add(new_url, new_description)          # no rebuild
+    """
+
+    def __init__(self, k1: float = DEFAULT_K1, b: float = DEFAULT_B):
+        self.k1 = k1
+        self.b = b
+        self.doc_ids = []      # row -> caller's id for the job
+        self.vocabulary = {}   # token -> term id
+
+        # CSR postings; rows added since the last score() wait in _pending
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._terms = np.zeros(0, dtype=np.int32)
+        self._counts = np.zeros(0, dtype=np.float32)
+        self._pending = []     # (term ids, counts) per new row
+
+        self._lengths = []     # row -> number of tokens
+        self._df = np.zeros(0, dtype=np.int64)  # term id -> rows containing it
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self.doc_ids)
+
+    def _term_id(self, token: str) -> int:
+        """Term id of a token, assigning a new one if unseen."""
+        term_id = self.vocabulary.get(token)
+        if term_id is None:
+            term_id = self.vocabulary[token] = len(self.vocabulary)
+        return term_id
+
+    def add(self, doc_id, text: str) -> int:
+        """
+        Add one job description to the index.
+
+        Args:
+            doc_id: Identifier returned by rank() (e.g. the job URL)
+            text: Job description
+
+        Returns:
+            int: Row of the job in score() results
+        """
+        tokens = index_tokens(text)
+        term_ids = np.fromiter((self._term_id(token) for token in tokens),
+                               dtype=np.int32, count=len(tokens))
+        terms, counts = np.unique(term_ids, return_counts=True)
+
+        if len(self.vocabulary) > len(self._df):
+            grown = np.zeros(max(len(self.vocabulary), 2 * len(self._df)), dtype=np.int64)
+            grown[:len(self._df)] = self._df
+            self._df = grown
+        self._df[terms] += 1
+
+        self._pending.append((terms, counts.astype(np.float32)))
+        self._lengths.append(len(tokens))
+        self._total_length += len(tokens)
+        self.doc_ids.append(doc_id)
+        return len(self.doc_ids) - 1
+
+    def add_many(self, doc_ids, texts) -> list:
+        """
+        Add several job descriptions.
+
+        Args:
+            doc_ids: Identifiers, same order as texts
+            texts: Job descriptions
+
+        Returns:
+            List of rows, one per job
+        """
+        return [self.add(doc_id, text) for doc_id, text in zip(doc_ids, texts)]
+
+    def _flush(self):
+        """Append pending rows to the CSR arrays."""
+        if not self._pending:
+            return
+        sizes = np.fromiter((len(terms) for terms, _ in self._pending), dtype=np.int64)
+        self._indptr = np.concatenate([self._indptr, self._indptr[-1] + np.cumsum(sizes)])
+        self._terms = np.concatenate([self._terms] + [terms for terms, _ in self._pending])
+        self._counts = np.concatenate([self._counts] + [counts for _, counts in self._pending])
+        self._pending = []
+
+    def score(self, query: dict) -> np.ndarray:
+        """
+        BM25 score of every indexed job against a weighted query.
+
+        Args:
+            query: {token: weight}, e.g. from resume_query()
+
+        Returns:
+            Array of scores, indexed by row
+        """
+        self._flush()
+        n_docs = len(self.doc_ids)
+        if not n_docs:
+            return np.zeros(0)
+
+        # Dense query weights over the vocabulary; unknown tokens never match
+        weights = np.zeros(len(self.vocabulary))
+        for token, weight in query.items():
+            term_id = self.vocabulary.get(token)
+            if term_id is not None:
+                weights[term_id] = weight
+
+        df = self._df[:len(self.vocabulary)]
+        idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+        term_weight = weights * idf
+
+        lengths = np.asarray(self._lengths, dtype=np.float64)
+        avg_length = self._total_length / n_docs or 1.0
+        norm = self.k1 * (1 - self.b + self.b * lengths / avg_length)
+
+        # One contribution per posting, summed per row
+        rows = np.repeat(np.arange(n_docs), np.diff(self._indptr))
+        tf = self._counts
+        contrib = term_weight[self._terms] * tf * (self.k1 + 1) / (tf + norm[rows])
+        return np.bincount(rows, weights=contrib, minlength=n_docs)
+
+    def rank(self, query: dict) -> list:
+        """
+        Jobs ordered by descending BM25 score.
+
+        Ties keep insertion order.
+
+        Args:
+            query: {token: weight}
+
+        Returns:
+            List of (doc_id, score)
+        """
+        scores = self.score(query)
+        order = np.argsort(-scores, kind="stable")
+        return [(self.doc_ids[row], float(scores[row])) for row in order]
+
+
+def resume_query(resume: dict, skill_weight: float = SKILL_WEIGHT) -> dict:
+    """
+    Build a BM25 query from a resume profile.
+
+    Every distinct token of the resume text gets weight 1; skill tokens
+    get skill_weight, so they dominate the general text.
+
+    Args:
+        resume: Resume profile (raw_text and skills)
+        skill_weight: Weight of skill tokens
+
+    Returns:
+        dict: {token: weight}
+    """
+    query = dict.fromkeys(index_tokens(resume.get("raw_text", "")), 1.0)
+    for skill in resume.get("skills", []):
+        for token in index_tokens(skill):
+            query[token] = skill_weight
+    return query
+
+
+def select_top_k(scored, k: int, spill=None) -> list:
+    """
+    Keep the k highest-scored items of a stream in a bounded heap.
+
+    The heap holds at most k entries however long the stream is (the
+    caller decides whether the stream itself is materialized); every
+    item that does not make the cut is handed to spill (if given) as
+    soon as it drops out.
+    Ties keep the earlier item.
+
+    Args:
+        scored: Iterable of (score, item)
+        k: Number of items to keep
+        spill: Callable receiving each item outside the top k
+
+    Returns:
+        List of the top k items, highest score first
+    """
+    heap = []
+    for seq, (score, item) in enumerate(scored):
+        # Later items compare lower on ties, so they are evicted first
+        entry = (score, -seq, item)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+            continue
+        if heap and entry[:2] > heap[0][:2]:
+            entry = heapq.heapreplace(heap, entry)
+        if spill:
+            spill(entry[2])
+    return [item for _, _, item in sorted(heap, key=lambda e: e[:2], reverse=True)]
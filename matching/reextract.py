@@ -0,0 +1,202 @@
+"""
+Re-extract - Offline batch run of build_job_profile over saved pages
+
+Re-runs the extractors on HTML that is already on disk, on all cores,
+without fetching anything:
+- the page archive (data/html_archive): each distinct page is parsed
+  once and its profile written for every URL pointing at it
+- a directory of saved pages (*.html, *.html.gz), e.g. a crawl dump
+
+Profiles are streamed to a JSONL corpus as workers finish them, so the
+output is usable (and memory stays flat) however large the input is.
+
+Usage:
+    python matching/reextract.py [--html-dir DIR] [--output data/jobs_raw.jsonl]
+                                 [--workers N] [--chunk-size N]
+
+The report gives pages per second, the share of pages that failed or
+yielded no title, and the mean time each extractor stage took per page.
+"""
+
+import argparse
+import gzip
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from matching.job_reader import build_job_profile
+from portals.job_corpus import JOBS_CORPUS, JobCorpusWriter
+from portals.page_archive import ARCHIVE_DIR, PageArchive, load_page
+
+HTML_PATTERNS = ("*.html", "*.html.gz")
+DEFAULT_CHUNK_SIZE = 16
+
+EMPTY_PROFILE = {"job_title": "", "company": "", "location": "", "description": ""}
+
+
+def read_html_file(path: Path) -> str:
+    """Read a saved page, gunzipping .gz files."""
+    path = Path(path)
+    data = path.read_bytes()
+    if path.suffix == ".gz":
+        data = gzip.decompress(data)
+    return data.decode("utf-8", errors="replace")
+
+
+def archive_tasks(root: Path = ARCHIVE_DIR):
+    """
+    One task per distinct archived page.
+
+    Yields:
+        ("archive", digest, [(url, job_key), ...], root)
+    """
+    archive = PageArchive(root)
+    try:
+        for digest, entries in archive.iter_pages():
+            yield "archive", digest, entries, archive.root
+    finally:
+        archive.close()
+
+
+def directory_tasks(html_dir: Path):
+    """
+    One task per saved page file under a directory (recursive).
+
+    Yields:
+        ("file", path, [("", "")], None)
+    """
+    paths = sorted(path for pattern in HTML_PATTERNS for path in Path(html_dir).rglob(pattern))
+    for path in paths:
+        yield "file", str(path), [("", "")], None
+
+
+def extract_page(task: tuple) -> tuple:
+    """
+    Worker: build the profile of one page.
+
+    Args:
+        task: (kind, source, entries, root) from archive_tasks/directory_tasks
+
+    Returns:
+        (jobs, timings, status) with status "ok", "empty" (no job title
+        found) or "error" (the page could not be read or parsed)
+    """
+    kind, source, entries, root = task
+    timings = {}
+    try:
+        start = time.perf_counter()
+        raw_html = load_page(source, root) if kind == "archive" else read_html_file(source)
+        timings["read"] = time.perf_counter() - start
+        profile = build_job_profile(raw_html, timings)
+        status = "ok" if profile["job_title"] else "empty"
+    except Exception as e:
+        profile = dict(EMPTY_PROFILE, error=f"{type(e).__name__}: {e}")
+        status = "error"
+
+    jobs = []
+    for url, job_key in entries:
+        job = dict(profile, url=url, job_key=job_key)
+        if kind == "archive":
+            job["archive_digest"] = source
+        else:
+            job["source_file"] = source
+        jobs.append(job)
+    return jobs, timings, status
+
+
+def reextract(tasks, output: Path = JOBS_CORPUS, workers: int = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """
+    Run extract_page over tasks in a process pool, streaming to a corpus.
+
+    Args:
+        tasks: Iterable of tasks (consumed lazily)
+        output: Corpus path to write (.jsonl, .jsonl.gz or .jsonl.zst)
+        workers: Worker processes (default: all cores)
+        chunk_size: Pages handed to a worker at a time
+
+    Returns:
+        dict: pages, jobs, ok/empty/error page counts, seconds (wall
+        time) and timings (total worker seconds per stage)
+    """
+    stats = {"pages": 0, "jobs": 0, "ok": 0, "empty": 0, "error": 0, "timings": {}}
+    start = time.perf_counter()
+    tasks = iter(tasks)
+    # Executor.map submits its whole input at once; feed it a window at a time
+    window = chunk_size * (workers or os.cpu_count() or 1) * 4
+
+    with ProcessPoolExecutor(max_workers=workers) as pool, JobCorpusWriter(output) as corpus:
+        while True:
+            batch = list(islice(tasks, window))
+            if not batch:
+                break
+            for jobs, timings, status in pool.map(extract_page, batch, chunksize=chunk_size):
+                _record(stats, corpus, jobs, timings, status)
+
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def _record(stats: dict, corpus: JobCorpusWriter, jobs: list, timings: dict, status: str):
+    """Write one page's jobs and add it to the run statistics."""
+    stats["pages"] += 1
+    stats[status] += 1
+    for stage, seconds in timings.items():
+        stats["timings"][stage] = stats["timings"].get(stage, 0.0) + seconds
+    for job in jobs:
+        corpus.write(job)
+    stats["jobs"] += len(jobs)
+
+
+def print_report(stats: dict, output: Path):
+    """Print throughput, failure rate and per-stage timings of a run."""
+    pages = stats["pages"]
+    if not pages:
+        print("❌ No pages found")
+        return
+
+    seconds = stats["seconds"]
+    print(f"✅ {stats['jobs']} jobs from {pages} pages in {seconds:.1f}s "
+          f"({pages / seconds:.1f} pages/s) → {output}")
+    print(f"   Parse failures: {stats['error']} ({stats['error'] / pages:.1%}), "
+          f"no title: {stats['empty']} ({stats['empty'] / pages:.1%})")
+
+    print("\n⏱️  Mean time per page (worker CPU):")
+    for stage, total in sorted(stats["timings"].items(), key=lambda item: -item[1]):
+        print(f"   {stage:<16} {total / pages * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-extract job profiles from saved HTML pages")
+    parser.add_argument("--html-dir", type=Path,
+                        help="Directory of saved pages (*.html, *.html.gz) instead of the archive")
+    parser.add_argument("--archive", type=Path, default=ARCHIVE_DIR,
+                        help=f"Page archive to read (default: {ARCHIVE_DIR})")
+    parser.add_argument("--output", type=Path, default=JOBS_CORPUS,
+                        help=f"Corpus to write (default: {JOBS_CORPUS})")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Pages per worker task (default: {DEFAULT_CHUNK_SIZE})")
+    args = parser.parse_args()
+
+    if args.html_dir:
+        print(f"🔁 Re-extracting job profiles from {args.html_dir} ...")
+        tasks = directory_tasks(args.html_dir)
+    else:
+        print(f"🔁 Re-extracting job profiles from {args.archive} ...")
+        tasks = archive_tasks(args.archive)
+
+    stats = reextract(tasks, args.output, args.workers, args.chunk_size)
+    print_report(stats, args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,27 +3,293 @@ Job Evaluation Runner - DAY 12
 
 This script:
 1. Loads your resume profile
-2. Loads scraped jobs from Indeed
-3. Evaluates each job against your profile
+2. Streams scraped jobs from the Indeed job corpus (data/jobs_raw.jsonl)
+3. Evaluates the jobs against your profile, chunk by chunk
 4. Generates APPLY/SKIP decisions with reasons
-5. Creates an application queue
+5. Creates an application queue, most relevant jobs first (BM25)
+
+Usage:
+    python matching/run_evaluation.py [--workers N] [--chunk-size N] [--explain]
+                                      [--top-k K [--spill]] [--no-dedup] [--no-cache]
+
+By default each job stops at its first failing filter (cheapest filters
+run first); --explain runs every filter and lists every reason.
+
+--workers N runs the MinHash signatures and the evaluation of each
+--chunk-size chunk on N processes (each builds its evaluator once). The
+job stream is pipelined: a few chunks per worker stay queued while the
+main process skips duplicates, reads the cache and handles results, so
+no worker waits for a batch to finish. Results keep the input order.
+
+--top-k K writes only the K most relevant APPLY jobs to apply_queue.json;
+with --spill the others go to data/apply_queue_spill.jsonl. It bounds
+the queue, not memory: every APPLY job is held and BM25-scored before
+the top K are picked.
+
+Near-identical reposts (MinHash/LSH over the description) are clustered:
+only the first job of a cluster is evaluated and queued, the others are
+listed under its "duplicates" (--no-dedup turns this off). Only jobs
+passing the location and company filters are clustered, and only with
+jobs of the same title, so a cluster's decision holds for every copy in
+it: a copy that is remote or from the direct employer is never hidden
+behind a rejected one.
+
+Decisions are cached in data/evaluation_cache.db keyed by job content,
+resume and settings, so re-runs only evaluate new or changed jobs.
+
+With several resume variants in resume/ (resume_ml.pdf, ...), each
+queued job gets the variant covering most of its skills
+("resume_variant"); the apply session fills and uploads that one.
 
 🚫 NO APPLYING - This is decision + planning only.
 """
 
+import argparse
 import json
 import yaml
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from matching.evaluator import evaluate_job, get_match_summary
+from matching.evaluator import JobEvaluator, get_match_summary
+from matching.dedup import NearDuplicateIndex, minhash_signature
+from matching.eval_cache import EvaluationCache
+from matching.ranking import BM25Index, resume_query, select_top_k
+from matching.skill_matcher import tokenize
+from portals.job_corpus import find_corpus, iter_jobs
+from portals.job_key import job_identity
+from resume.library import ResumeLibrary
+
+
+SPILL_PATH = "data/apply_queue_spill.jsonl"
+
+# Chunks each pipeline stage keeps queued per worker process, so workers
+# never wait on the main process between chunks
+CHUNKS_IN_FLIGHT = 2
+
+# Evaluator of the current worker process, built once by _init_worker
+_worker_evaluator = None
+
+
+def _init_worker(resume: dict, settings: dict, mode: str):
+    """Process pool initializer: compile the evaluator once per worker."""
+    global _worker_evaluator
+    # One title-scoring thread per process; the pool provides the parallelism
+    _worker_evaluator = JobEvaluator(resume, settings, workers=1, mode=mode)
+
+
+def _evaluate_chunk(jobs: list) -> list:
+    """Evaluate one chunk of jobs in a worker process."""
+    return _worker_evaluator.evaluate_many(jobs)
+
+
+def _sign_chunk(jobs: list) -> list:
+    """Near-duplicate signatures of one chunk of jobs in a worker process."""
+    return cluster_signatures(jobs, _worker_evaluator)
+
+
+def create_pool(resume: dict, settings: dict, workers: int, mode: str = "fast") -> ProcessPoolExecutor:
+    """Process pool whose workers each hold a compiled JobEvaluator."""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(resume, settings, mode)
+    )
+
+
+def _map_stage(items, local, pool: ProcessPoolExecutor = None, task=None, in_flight: int = 1):
+    """
+    One pipeline stage: apply a function to a stream, yielding in order.
+    
+    On a pool, payloads are submitted as the stream yields them and up
+    to in_flight tasks are kept queued, so workers go on with the next
+    chunks while the caller handles earlier results.
+    
+    Args:
+        items: Iterable of (key, payload), consumed lazily
+        local: In-process function of a payload (without a pool)
+        pool: Process pool from create_pool(), or None
+        task: Picklable worker function of a payload
+        in_flight: Tasks kept queued ahead of the caller
+    
+    Yields:
+        (key, result) in input order
+    """
+    if pool is None:
+        for key, payload in items:
+            yield key, local(payload)
+        return
+    
+    queued = deque()
+    for key, payload in items:
+        queued.append((key, pool.submit(task, payload)))
+        if len(queued) >= in_flight:
+            key, future = queued.popleft()
+            yield key, future.result()
+    while queued:
+        key, future = queued.popleft()
+        yield key, future.result()
+
+
+def _cache_lookups(chunks, cache: EvaluationCache = None):
+    """Split each chunk into cached decisions and the jobs to evaluate."""
+    for jobs in chunks:
+        cached = cache.get_many(jobs) if cache else {}
+        pending = [job for i, job in enumerate(jobs) if i not in cached]
+        yield (jobs, cached, pending), pending
+
+
+def decide_chunks(chunks, evaluator: JobEvaluator, cache: EvaluationCache = None,
+                  pool: ProcessPoolExecutor = None, in_flight: int = 1):
+    """
+    Decisions for a stream of job chunks.
+    
+    Cache hits are served as-is; the rest are evaluated (on the pool if
+    given, else in-process) and stored in the cache.
+    
+    Args:
+        chunks: Iterable of job lists, consumed lazily
+        evaluator: In-process evaluator
+        cache: Evaluation cache, or None
+        pool: Process pool from create_pool(), or None
+        in_flight: Chunks kept queued on the pool
+    
+    Yields:
+        (jobs, decisions): each chunk with its decisions, in input order
+    """
+    stage = _map_stage(_cache_lookups(chunks, cache), evaluator.evaluate_many,
+                       pool, _evaluate_chunk, in_flight)
+    for (jobs, cached, pending), new_decisions in stage:
+        if cache:
+            cache.put_many(pending, new_decisions)
+        
+        # Merge cached and fresh decisions back into input order
+        fresh = iter(new_decisions)
+        yield jobs, [cached[i] if i in cached else next(fresh) for i in range(len(jobs))]
+
 
+def _batches(iterable, size: int):
+    """Split an iterable into lists of up to size items."""
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
 
-def main():
+
+def _clusterable(job: dict, evaluator: JobEvaluator) -> bool:
+    """True if a job passes the filters that differ between copies of a posting."""
+    return evaluator.location_ok(job.get("location") or "") and not evaluator.company_blocked(job.get("company"))
+
+
+def cluster_signatures(jobs: list, evaluator: JobEvaluator) -> list:
+    """
+    Near-duplicate group and MinHash signature of each job.
+    
+    Args:
+        jobs: List of job profile dictionaries
+        evaluator: Evaluator for the per-copy filters
+    
+    Returns:
+        One (normalized title, signature) per job; None for jobs that are
+        not clustered (failing a per-copy filter, or no description)
+    """
+    signatures = []
+    for job in jobs:
+        signature = minhash_signature(job.get("description", "")) if _clusterable(job, evaluator) else None
+        title = " ".join(tokenize(job.get("job_title") or ""))
+        signatures.append(None if signature is None else (title, signature))
+    return signatures
+
+
+def _unique_jobs(jobs, counts: dict):
+    """
+    Skip other URL variants of a posting already read in this run.
+    
+    Yields:
+        Job dictionaries with "job_key" set; counts["read"] and
+        counts["duplicates"] are updated as the stream is consumed
+    """
+    seen_keys = set()
+    for job in jobs:
+        counts["read"] += 1
+        job_key = job.get("job_key") or job_identity(job.get("url", ""))
+        if job_key and job_key in seen_keys:
+            counts["duplicates"] += 1
+            continue
+        # An empty profile (blocked page, read error) does not claim
+        # the key: the job is read again and its real profile follows
+        if job.get("job_title") or job.get("description"):
+            seen_keys.add(job_key)
+        job["job_key"] = job_key
+        yield job
+
+
+def _representatives(signed_jobs, near_duplicates: NearDuplicateIndex,
+                     cluster_members: dict, counts: dict):
+    """
+    Skip reposts of a job already in this run, recording them instead.
+    
+    Jobs failing the per-copy filters come without a signature and are
+    evaluated on their own.
+    
+    Yields:
+        Jobs to evaluate; counts["near_duplicates"] is updated
+    """
+    for job, cluster in signed_jobs:
+        if cluster is not None and job["job_key"]:
+            title, signature = cluster
+            rep_key = near_duplicates.add_signature(job["job_key"], signature, title)
+            if rep_key is not None:
+                cluster_members.setdefault(rep_key, []).append(job.get("url", ""))
+                counts["near_duplicates"] += 1
+                continue
+        yield job
+
+
+def _fmt(value, unit: str = "") -> str:
+    """Format a metric that fast mode may have skipped (None)."""
+    return "n/a" if value is None else f"{value}{unit}"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate scraped jobs and build the apply queue")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for evaluation (default: 1, in-process)")
+    parser.add_argument("--chunk-size", type=int, default=500,
+                        help="Jobs per worker task (default: 500)")
+    parser.add_argument("--explain", action="store_true",
+                        help="Run every filter and report all reasons (default: stop at first rejection)")
+    parser.add_argument("--top-k", type=int, default=None, metavar="K",
+                        help="Queue only the K most relevant APPLY jobs")
+    parser.add_argument("--spill", action="store_true",
+                        help=f"With --top-k, write the remaining APPLY jobs to {SPILL_PATH}")
+    parser.add_argument("--no-dedup", action="store_true",
+                        help="Evaluate near-duplicate reposts instead of only one job per cluster")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-evaluate every job instead of using data/evaluation_cache.db")
+    args = parser.parse_args(argv)
+    
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("--workers and --chunk-size must be 1 or more")
+    if args.top_k is not None and args.top_k < 0:
+        parser.error("--top-k must be 0 or more")
+    if args.spill and args.top_k is None:
+        parser.error("--spill needs --top-k")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    
     print("=" * 60)
     print("🧠 DAY 12: Job Evaluation & Application Queue")
     print("=" * 60)
@@ -39,14 +305,19 @@ def main():
     print(f"   Experience: {resume.get('experience_years', 0)} years")
     print(f"   Skills: {len(resume.get('skills', []))} skills loaded")
     
-    # Load jobs
-    jobs_path = Path("data/jobs_raw.json")
-    if not jobs_path.exists():
+    # Tailored variants: pick one per queued job
+    library = ResumeLibrary()
+    if len(library) > 1:
+        print(f"   Variants: {', '.join(library.names)}")
+    else:
+        library = None
+    
+    # Jobs are streamed from the corpus, a chunk at a time
+    jobs_path = find_corpus()
+    if jobs_path is None:
         print("❌ Jobs file not found. Run Day 11 first!")
         return
-    
-    jobs = json.load(open(jobs_path, encoding="utf-8"))
-    print(f"\n📋 Jobs to evaluate: {len(jobs)}")
+    print(f"\n📋 Reading jobs from: {jobs_path}")
     
     # Load settings
     settings = yaml.safe_load(open("config/settings.yaml", encoding="utf-8"))
@@ -55,45 +326,125 @@ def main():
     print(f"   Min skill match: {settings['filters']['min_skill_match']} skills")
     print(f"   Max extra experience: {settings['experience']['max_extra_years']} years")
     
-    # Evaluate each job
     results = []
     apply_queue = []
+    # Descriptions of APPLY jobs, indexed as they are decided
+    index = BM25Index()
+    # Skill vectors of APPLY jobs, for resume variant selection
+    job_vectors = []
+    
+    mode = "explain" if args.explain else "fast"
+    evaluator = JobEvaluator(resume, settings, mode=mode)
+    
+    # Serve unchanged jobs from the evaluation cache
+    cache = None if args.no_cache else EvaluationCache(resume, settings, evaluator.variant)
+    
+    # Evaluate the rest with an evaluator compiled once (per worker)
+    pool = None
+    if args.workers > 1:
+        print(f"\n🧵 Evaluating with {args.workers} worker processes")
+        pool = create_pool(resume, settings, args.workers, mode)
     
     print("\n" + "-" * 60)
     print("📊 EVALUATION RESULTS")
     print("-" * 60)
     
-    for idx, job in enumerate(jobs, 1):
-        decision = evaluate_job(resume, job, settings)
-        
-        job_result = {
-            "job_title": job.get("job_title", "Unknown"),
-            "company": job.get("company", "Unknown"),
-            "location": job.get("location", "Unknown"),
-            "url": job.get("url", ""),
-            "decision": decision["decision"],
-            "reasons": decision["reasons"],
-            "metrics": {
-                "title_match": decision["title_match"],
-                "skill_match": decision["skill_match"],
-                "job_experience": decision["job_experience"]
-            }
-        }
+    corpus_stats = {}
+    counts = {"read": 0, "duplicates": 0, "near_duplicates": 0}
+    cluster_members = {}   # representative job key -> URLs of its near-duplicates
+    # Per-stage queue depth: enough chunks for every worker, plus the next ones
+    in_flight = args.workers * CHUNKS_IN_FLIGHT
+    try:
+        # Streamed end to end: the main process skips duplicates and reads
+        # the cache while workers sign and evaluate the chunks around them
+        jobs = _unique_jobs(iter_jobs(jobs_path, corpus_stats), counts)
+        if not args.no_dedup:
+            # Reposts of a job already in this run: record, don't evaluate
+            signed = _map_stage(
+                ((chunk, chunk) for chunk in _batches(jobs, args.chunk_size)),
+                partial(cluster_signatures, evaluator=evaluator), pool, _sign_chunk, in_flight
+            )
+            signed_jobs = (pair for chunk, signatures in signed for pair in zip(chunk, signatures))
+            jobs = _representatives(signed_jobs, NearDuplicateIndex(), cluster_members, counts)
         
-        results.append(job_result)
-        
-        # Print result
-        emoji = "✅" if decision["decision"] == "APPLY" else "❌"
-        print(f"\n{idx}. {emoji} {job_result['job_title'][:45]}")
-        print(f"   Company: {job_result['company'][:30]}")
-        print(f"   Title Match: {decision['title_match']}% | Skills: {decision['skill_match']} | Exp: {decision['job_experience']}yr")
-        print(f"   → {decision['decision']}: {', '.join(decision['reasons'][:2])}")
-        
-        if decision["decision"] == "APPLY":
-            apply_queue.append(job_result)
+        chunks = _batches(jobs, args.chunk_size)
+        for chunk, decisions in decide_chunks(chunks, evaluator, cache, pool, in_flight):
+            for job, decision in zip(chunk, decisions):
+                job_key = job["job_key"]
+                job_result = {
+                    "job_title": job.get("job_title", "Unknown"),
+                    "company": job.get("company", "Unknown"),
+                    "location": job.get("location", "Unknown"),
+                    "url": job.get("url", ""),
+                    "job_key": job_key,
+                    "decision": decision["decision"],
+                    "reasons": decision["reasons"],
+                    "metrics": {
+                        "title_match": decision["title_match"],
+                        "skill_match": decision["skill_match"],
+                        "job_experience": decision["job_experience"]
+                    },
+                    # Shared list: members found later in the stream show up here too
+                    "duplicates": cluster_members.setdefault(job_key, []) if job_key else []
+                }
+                
+                results.append(job_result)
+                
+                # Print result
+                emoji = "✅" if decision["decision"] == "APPLY" else "❌"
+                print(f"\n{len(results)}. {emoji} {job_result['job_title'][:45]}")
+                print(f"   Company: {job_result['company'][:30]}")
+                print(f"   Title Match: {_fmt(decision['title_match'], '%')} | Skills: {_fmt(decision['skill_match'])} | Exp: {_fmt(decision['job_experience'], 'yr')}")
+                print(f"   → {decision['decision']}: {', '.join(decision['reasons'][:2])}")
+                
+                if decision["decision"] == "APPLY":
+                    index.add(len(apply_queue), job.get("description", ""))
+                    if library:
+                        job_vectors.append(library.job_vector(job.get("description", "")))
+                    apply_queue.append(job_result)
+    finally:
+        if pool:
+            pool.shutdown()
+    duplicates = counts["duplicates"]
+    near_duplicate_count = counts["near_duplicates"]
+    
+    cache_stats = None
+    if cache:
+        cache_stats = (cache.hits, cache.misses, cache.close())
     
     print("\n" + "-" * 60)
     
+    # Most relevant first, so session limits spend applications well
+    for job_result, score in zip(apply_queue, index.score(resume_query(resume))):
+        job_result["relevance"] = round(float(score), 3)
+    if library:
+        for job_result, variant in zip(apply_queue, library.select(job_vectors)):
+            job_result["resume_variant"] = library.variants[variant].name
+    candidates = len(apply_queue)
+    
+    # --top-k caps the queue at the best K (BM25 needs every candidate's
+    # document frequencies, so all candidates are scored first); the rest
+    # go to the spill file
+    spill_path = Path(SPILL_PATH)
+    spill_file = None
+    if args.top_k is not None and args.spill:
+        spill_file = open(spill_path, "w", encoding="utf-8")
+    else:
+        spill_path.unlink(missing_ok=True)
+    
+    def spill(job_result):
+        spill_file.write(json.dumps(job_result, ensure_ascii=False) + "\n")
+    
+    try:
+        apply_queue = select_top_k(
+            ((job_result["relevance"], job_result) for job_result in apply_queue),
+            candidates if args.top_k is None else args.top_k,
+            spill if spill_file else None
+        )
+    finally:
+        if spill_file:
+            spill_file.close()
+    
     # Save evaluation results
     with open("data/evaluation_results.json", "w", encoding="utf-8") as f:
         json.dump(results, f, indent=2, ensure_ascii=False)
@@ -109,13 +460,26 @@ def main():
     print("📊 SUMMARY")
     print("=" * 60)
     print(f"   Total jobs evaluated: {len(results)}")
-    print(f"   ✅ APPLY: {len(apply_queue)} jobs")
-    print(f"   ❌ SKIP: {len(results) - len(apply_queue)} jobs")
+    if corpus_stats.get("malformed"):
+        print(f"   ⚠️  Malformed corpus lines skipped: {corpus_stats['malformed']}")
+    if duplicates:
+        print(f"   🔁 Duplicate postings skipped: {duplicates}")
+    if near_duplicate_count:
+        print(f"   🧬 Near-duplicate reposts skipped: {near_duplicate_count}")
+    if cache_stats:
+        hits, misses, evicted = cache_stats
+        print(f"   🗃️  Evaluation cache: {hits} hits, {misses} misses, {evicted} evicted")
+    print(f"   ✅ APPLY: {candidates} jobs")
+    print(f"   ❌ SKIP: {len(results) - candidates} jobs")
+    if len(apply_queue) < candidates:
+        where = f" (spilled to {SPILL_PATH})" if args.spill else ""
+        print(f"   🔝 Queued top {len(apply_queue)}, {candidates - len(apply_queue)} not queued{where}")
     
     if apply_queue:
         print(f"\n📋 APPLY QUEUE:")
         for i, job in enumerate(apply_queue, 1):
-            print(f"   {i}. {job['job_title'][:40]} @ {job['company'][:25]}")
+            variant = f", resume: {job['resume_variant']}" if "resume_variant" in job else ""
+            print(f"   {i}. {job['job_title'][:40]} @ {job['company'][:25]} (BM25 {job['relevance']}{variant})")
     else:
         print("\n⚠️  No jobs matched criteria. Consider adjusting settings.yaml thresholds.")
     
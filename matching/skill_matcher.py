@@ -0,0 +1,207 @@
+"""
+Skill Matcher - Single-pass multi-skill search (Aho-Corasick)
+
+Finds every known skill in a text in one pass over the text, instead of
+one substring search per skill. Cost per text is linear in its length,
+no matter how many skills and synonyms the automaton was built from.
+
+The automaton runs over word tokens rather than characters: the text is
+split into tokens by one compiled regex and skills are token sequences.
+That makes matches respect word boundaries ("go" does not match inside
+"google", "r" not inside "docker") and treats "scikit-learn" /
+"scikit learn" and "node.js" / "node js" / "Python.Node.js" alike. A
+dotted skill also matches its compact spelling ("nodejs"), and aliases
+("sklearn") are extra patterns reported under their canonical skill
+name.
+
+The master list itself is loaded and cached by matching.skills_index.
+"""
+
+import re
+from collections import deque, namedtuple
+
+# Word tokens; keeps "c++", "c#" and a dot starting a word (".net") in the
+# token, while a dot inside a word separates tokens ("node.js" = "node js")
+TOKEN_PATTERN = re.compile(r"(?:(?<![a-z0-9_+#])\.)?[a-z0-9_]+[+#]*")
+
+# A dot between two word characters, dropped for a skill's compact spelling
+INNER_DOT = re.compile(r"(?<=[a-z0-9_])\.(?=[a-z0-9_])")
+
+# A matched skill and its [start, end) position in text.lower()
+SkillMatch = namedtuple("SkillMatch", ["skill", "start", "end"])
+
+
+def tokenize(text: str) -> list:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: Any text
+
+    Returns:
+        List of tokens
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def normalize_skill(skill: str) -> str:
+    """
+    Normalize a skill for matching: lowercase tokens joined by spaces.
+
+    Args:
+        skill: Skill name
+
+    Returns:
+        Normalized skill key
+    """
+    return " ".join(tokenize(skill))
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton compiled from a list of skills.
+
+    Build once, then call find_all / find_skills for every text.
+    """
+
+    def __init__(self, skills, aliases: dict = None):
+        """
+        Args:
+            skills: Skill names
+            aliases: Optional {alias: skill name}; an alias is matched like
+                a skill but reported as the skill it stands for
+        """
+        self._goto = [{}]     # state -> {token: next state}
+        self._fail = [0]      # state -> failure state
+        self._output = [[]]   # state -> indexes of skills ending here
+        self._lengths = []    # skill index -> number of tokens
+        self._names = []      # skill index -> skill (or aliased skill) as first given
+        self._index = {}      # normalized key -> skill index
+        self._vocabulary = set()  # every token that appears in some skill
+
+        for skill in skills:
+            self._add(skill)
+        for skill in skills:
+            # "node.js" is also written "nodejs"
+            compact = INNER_DOT.sub("", skill.lower())
+            if compact != skill.lower():
+                self._add(compact, skill)
+        for alias, skill in (aliases or {}).items():
+            self._add(alias, skill)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(set(self._names))
+
+    def __contains__(self, skill: str) -> bool:
+        return normalize_skill(skill) in self._index
+
+    def _add(self, skill: str, name: str = None):
+        """Insert one skill (or an alias reported as name) into the trie."""
+        tokens = tokenize(skill)
+        key = " ".join(tokens)
+        if not key or key in self._index:
+            return
+
+        self._vocabulary.update(tokens)
+
+        state = 0
+        for token in tokens:
+            next_state = self._goto[state].get(token)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._goto[state][token] = next_state
+            state = next_state
+
+        self._index[key] = len(self._names)
+        self._output[state].append(len(self._names))
+        self._lengths.append(len(tokens))
+        self._names.append((name or skill).strip())
+
+    def _build_failure_links(self):
+        """Breadth-first pass computing failure links and merged outputs."""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail = self._goto[fail].get(token, 0)
+                self._fail[next_state] = fail
+                self._output[next_state] = self._output[next_state] + self._output[fail]
+
+    def _scan(self, tokens: list) -> list:
+        """
+        Run the automaton over a token list.
+
+        Tokens outside the skill vocabulary have no transition from any
+        state, so they are filtered out up front and only act as a reset
+        between the known tokens around them.
+
+        Returns:
+            List of (skill index, first token index, last token index)
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        lengths = self._lengths
+        vocabulary = self._vocabulary
+
+        known = [(i, token) for i, token in enumerate(tokens) if token in vocabulary]
+
+        hits = []
+        state = 0
+        previous = -2
+        for i, token in known:
+            if i != previous + 1:
+                state = 0
+            previous = i
+
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+
+            for idx in output[state]:
+                hits.append((idx, i - lengths[idx] + 1, i))
+
+        return hits
+
+    def find_all(self, text: str) -> list:
+        """
+        Find all skill occurrences in a text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            List of SkillMatch, in order of end position
+        """
+        lowered = text.lower()
+        hits = self._scan(TOKEN_PATTERN.findall(lowered))
+        if not hits:
+            return []
+
+        spans = [token_match.span() for token_match in TOKEN_PATTERN.finditer(lowered)]
+        return [
+            SkillMatch(self._names[idx], spans[first][0], spans[last][1])
+            for idx, first, last in hits
+        ]
+
+    def find_skills(self, text: str) -> set:
+        """
+        Find which skills occur in a text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Set of skill names (as given when the matcher was built; aliases
+            reported as their skill)
+        """
+        names = self._names
+        return {names[idx] for idx, _, _ in self._scan(tokenize(text))}
+
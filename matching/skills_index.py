@@ -0,0 +1,177 @@
+"""
+Skills Index - The skills master list, loaded once per process
+
+The resume parser and the job evaluator both get their skills from here,
+so data/skills_master_list.txt is read, normalized and compiled once:
+- entries are normalized to lowercase word tokens, so case and
+  punctuation do not matter ("Node.js" / "node js", "CI/CD" / "ci cd");
+  the matchers also accept a dotted skill's compact form ("nodejs")
+- variants map to one canonical skill: the built-in SKILL_VARIANTS
+  ("sklearn" -> "scikit-learn") plus "|"-separated alternatives on a
+  list line ("kubernetes | k8s", first name canonical)
+- compiled SkillMatcher automatons are kept per set of extra skills
+
+get_skills_index() checks the file's mtime and size (one stat) on every
+call, so an edited list is reloaded and recompiled on next use.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from matching.skill_matcher import SkillMatcher, normalize_skill
+
+SKILLS_MASTER_FILE = Path("data/skills_master_list.txt")
+
+# Canonical skill -> variants reported as that skill
+SKILL_VARIANTS = {
+    "scikit-learn": ("sklearn",),
+    "node.js": ("nodejs",),
+    "react": ("react.js", "reactjs"),
+    "vue": ("vue.js", "vuejs"),
+    "angular": ("angularjs", "angular.js"),
+    "go": ("golang",),
+    "c++": ("cpp",),
+    "c#": ("csharp",),
+    "postgresql": ("postgres",),
+    "mongodb": ("mongo",),
+    "kubernetes": ("k8s",),
+    "aws": ("amazon web services",),
+    "azure": ("microsoft azure",),
+    "gcp": ("google cloud", "google cloud platform"),
+    "machine learning": ("ml",),
+    "natural language processing": ("nlp",),
+    "artificial intelligence": ("ai",),
+    "ci/cd": ("cicd", "continuous integration"),
+    "rest api": ("rest apis", "restful api", "restful apis"),
+}
+
+# Alternatives separator on a master list line
+VARIANT_SEPARATOR = "|"
+
+
+def _file_stamp(path: Path):
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SkillsIndex:
+    """
+    Canonical skills of the master list with their variants.
+
+    Usage:
+        index = get_skills_index()
+        index.find_skills(text)                       # canonical names
+        index.matcher(tuple(resume["skills"]))        # + extra skills
+        index.canonical_key("sklearn")                # "scikit learn"
+    """
+
+    def __init__(self, path: Path = SKILLS_MASTER_FILE, variants: dict = SKILL_VARIANTS):
+        self.path = Path(path)
+        self.stamp = _file_stamp(self.path)
+        raw = self.path.read_bytes() if self.stamp else b""
+
+        self.skills = []      # canonical names, in list order
+        self._canonical = {}  # normalized key (skill or variant) -> canonical name
+        self._aliases = {}    # variant -> canonical name, for the matchers
+        self._matchers = {}   # extra skills tuple -> SkillMatcher
+
+        for skill, alternatives in variants.items():
+            self._add_group(skill, alternatives)
+        for line in raw.decode("utf-8").splitlines():
+            names = [name.strip() for name in line.split(VARIANT_SEPARATOR) if name.strip()]
+            if names:
+                self._add_group(names[0], names[1:], listed=True)
+
+        # Content of both sources: changes whenever matching results can
+        self.version = hashlib.sha256(
+            raw + json.dumps(variants, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def __contains__(self, skill: str) -> bool:
+        return normalize_skill(skill) in self._canonical
+
+    def _add_group(self, skill: str, variants, listed: bool = False):
+        """
+        Register a skill and its variants.
+
+        Built-in groups only define variants; a skill becomes part of the
+        index when the master list names it (or any of its variants).
+        """
+        key = normalize_skill(skill)
+        if not key:
+            return
+        canonical = self._canonical.get(key, skill)
+        self._canonical.setdefault(key, canonical)
+
+        for variant in variants:
+            variant_key = normalize_skill(variant)
+            if variant_key and variant_key not in self._canonical:
+                self._canonical[variant_key] = canonical
+                self._aliases[variant] = canonical
+
+        if listed and canonical not in self.skills:
+            self.skills.append(canonical)
+
+    def canonical(self, skill: str) -> str:
+        """Canonical name of a skill or variant (unknown skills unchanged)."""
+        return self._canonical.get(normalize_skill(skill), skill.strip())
+
+    def canonical_key(self, skill: str) -> str:
+        """Normalized key of a skill's canonical name, for set comparisons."""
+        return normalize_skill(self.canonical(skill))
+
+    def matcher(self, extra_skills: tuple = ()) -> SkillMatcher:
+        """
+        Compiled matcher for the master list plus extra skills.
+
+        Built once per distinct extra_skills tuple (e.g. the resume
+        skills) and reused for every text after that. Variants of any
+        skill are reported under its canonical name.
+
+        Args:
+            extra_skills: Additional skills to recognize (must be a tuple)
+
+        Returns:
+            SkillMatcher
+        """
+        matcher = self._matchers.get(extra_skills)
+        if matcher is None:
+            skills = self.skills + [self.canonical(skill) for skill in extra_skills]
+            known = set(skills)
+            aliases = {alias: skill for alias, skill in self._aliases.items() if skill in known}
+            matcher = SkillMatcher(skills, aliases)
+            self._matchers[extra_skills] = matcher
+        return matcher
+
+    def find_skills(self, text: str) -> set:
+        """Canonical names of the master list skills found in a text."""
+        return self.matcher().find_skills(text)
+
+
+_index = None
+
+
+def get_skills_index(path: Path = SKILLS_MASTER_FILE) -> SkillsIndex:
+    """
+    Get the shared skills index, reloading it if the list file changed.
+
+    Args:
+        path: Skills master list
+
+    Returns:
+        SkillsIndex
+    """
+    global _index
+    path = Path(path)
+    if _index is None or _index.path != path or _index.stamp != _file_stamp(path):
+        _index = SkillsIndex(path)
+    return _index
+
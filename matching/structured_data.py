@@ -0,0 +1,249 @@
+"""
+Structured Data Extractor - schema.org JobPosting from raw HTML
+
+Indeed and most employer career pages embed the posting as JSON-LD:
+
+    <script type="application/ld+json">{"@type": "JobPosting", ...}</script>
+
+with title, hiringOrganization, jobLocation, datePosted, baseSalary and
+the description. This module reads that block straight from the page
+HTML (a regex finds the script tags, json parses them; no DOM), falling
+back to schema.org microdata (itemtype=".../JobPosting") when a page has
+no JSON-LD. The result is a flat dict of the fields the page supplied;
+heuristics and selectors are only needed for what is missing.
+"""
+
+import html
+import json
+import re
+
+from bs4 import BeautifulSoup
+
+JSON_LD_PATTERN = re.compile(
+    r"<script[^>]*\btype\s*=\s*[\"']?application/ld\+json[\"']?[^>]*>(.*?)</script\s*>",
+    re.IGNORECASE | re.DOTALL
+)
+MICRODATA_MARKER = re.compile(r"itemtype\s*=\s*[\"']?https?://schema\.org/JobPosting", re.IGNORECASE)
+
+JOB_POSTING = "JobPosting"
+REMOTE_LOCATION_TYPE = "TELECOMMUTE"
+
+# Microdata elements whose value is an attribute rather than their text
+MICRODATA_VALUE_ATTRS = {
+    "meta": "content", "a": "href", "link": "href", "time": "datetime",
+    "data": "value", "meter": "value", "img": "src",
+}
+
+
+def _iter_nodes(data):
+    """Yield every JSON object in a JSON-LD document (lists and @graph included)."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_nodes(data["@graph"])
+
+
+def _is_job_posting(node: dict) -> bool:
+    """True for a JSON-LD node typed JobPosting."""
+    types = node.get("@type", [])
+    return JOB_POSTING in (types if isinstance(types, list) else [types])
+
+
+def find_json_ld_posting(raw_html: str):
+    """
+    Find the first JobPosting JSON-LD object in a page.
+
+    Args:
+        raw_html: Page HTML
+
+    Returns:
+        dict or None
+    """
+    for match in JSON_LD_PATTERN.finditer(raw_html):
+        block = match.group(1).strip()
+        # Some sites wrap the JSON in an HTML comment / CDATA
+        block = re.sub(r"^(<!--|<!\[CDATA\[)|(-->|\]\]>)$", "", block).strip()
+        try:
+            data = json.loads(block, strict=False)
+        except ValueError:
+            continue
+        for node in _iter_nodes(data):
+            if _is_job_posting(node):
+                return node
+    return None
+
+
+def _is_job_posting_type(itemtype) -> bool:
+    """True for a JobPosting itemtype URL."""
+    return bool(itemtype) and itemtype.rstrip("/").endswith("schema.org/" + JOB_POSTING)
+
+
+def _microdata_value(tag, name: str):
+    """Value of a non-scope itemprop element."""
+    if name == "description" and not tag.has_attr("content"):
+        # Keep the markup, like JSON-LD descriptions, so lines survive cleaning
+        return tag.decode_contents()
+    if tag.has_attr("content"):
+        return tag["content"]
+    attr = MICRODATA_VALUE_ATTRS.get(tag.name)
+    if attr and tag.has_attr(attr):
+        return tag[attr]
+    return tag.get_text(" ", strip=True)
+
+
+def _collect_props(tag, item: dict):
+    """Add the itemprops below tag (down to nested scopes) to item."""
+    for child in tag.find_all(True, recursive=False):
+        names = child.get("itemprop", "").split()
+        nested = child.has_attr("itemscope")
+        for name in names:
+            value = _microdata_item(child) if nested else _microdata_value(child, name)
+            item.setdefault(name, value)
+        if not nested:
+            _collect_props(child, item)
+
+
+def _microdata_item(scope) -> dict:
+    """Properties of one itemscope element (nested scopes become dicts)."""
+    item = {"@type": scope.get("itemtype", "").rstrip("/").rsplit("/", 1)[-1]}
+    _collect_props(scope, item)
+    return item
+
+
+def find_microdata_posting(raw_html: str):
+    """
+    Find a JobPosting described with microdata.
+
+    The page is only parsed when it mentions the JobPosting itemtype.
+
+    Args:
+        raw_html: Page HTML
+
+    Returns:
+        dict shaped like the JSON-LD object, or None
+    """
+    if not MICRODATA_MARKER.search(raw_html):
+        return None
+    soup = BeautifulSoup(raw_html, "html.parser")
+    scope = soup.find(attrs={"itemtype": _is_job_posting_type})
+    return _microdata_item(scope) if scope else None
+
+
+def _text(value) -> str:
+    """Plain string of a JSON-LD text value (entities decoded)."""
+    if isinstance(value, list):
+        value = value[0] if value else ""
+    if isinstance(value, dict):
+        value = value.get("name") or value.get("@value") or ""
+    return html.unescape(str(value)).strip() if value is not None else ""
+
+
+def _location(posting: dict) -> str:
+    """'City, Region' of the first jobLocation; 'Remote' for telecommute jobs."""
+    places = posting.get("jobLocation") or []
+    if isinstance(places, dict):
+        places = [places]
+
+    parts = []
+    for place in places:
+        address = place.get("address", place) if isinstance(place, dict) else place
+        if isinstance(address, dict):
+            parts = [_text(address.get(key)) for key in ("addressLocality", "addressRegion")]
+            parts = [part for part in parts if part] or [_text(address.get("addressCountry"))]
+        else:
+            parts = [_text(address)]
+        parts = [part for part in parts if part]
+        if parts:
+            break
+
+    location = ", ".join(parts)
+    location_type = _text(posting.get("jobLocationType")).upper()
+    if location_type == REMOTE_LOCATION_TYPE:
+        return f"Remote ({location})" if location else "Remote"
+    return location
+
+
+def _number(raw):
+    """Float of a JSON-LD number or numeric string, else None."""
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def _description_html(posting: dict) -> str:
+    """Description markup; entity-escaped markup is unescaped once."""
+    description = posting.get("description") or ""
+    if isinstance(description, list):
+        description = " ".join(map(str, description))
+    if "<" not in description and "&lt;" in description:
+        description = html.unescape(description)
+    return description
+
+
+def _salary(posting: dict):
+    """baseSalary as {"currency", "min", "max", "unit"}, or None."""
+    salary = posting.get("baseSalary") or posting.get("estimatedSalary")
+    if isinstance(salary, list):
+        salary = salary[0] if salary else None
+    if not isinstance(salary, dict):
+        return None
+
+    value = salary.get("value", {})
+    if not isinstance(value, dict):
+        value = {"value": value}
+
+    low = _number(value.get("minValue", value.get("value")))
+    high = _number(value.get("maxValue", value.get("value")))
+    if low is None and high is None:
+        return None
+    return {
+        "currency": _text(salary.get("currency")),
+        "min": low,
+        "max": high,
+        "unit": _text(value.get("unitText") or salary.get("unitText")),
+    }
+
+
+def extract_structured_job(raw_html: str) -> dict:
+    """
+    Extract a job profile from JSON-LD (preferred) or microdata.
+
+    Args:
+        raw_html: Page HTML
+
+    Returns:
+        dict with the fields the page supplied (empty if none):
+        job_title, company, location, description_html, date_posted,
+        valid_through, employment_type, salary, and "source"
+        ("json-ld" or "microdata")
+    """
+    posting = find_json_ld_posting(raw_html)
+    source = "json-ld"
+    if posting is None:
+        posting = find_microdata_posting(raw_html)
+        source = "microdata"
+    if posting is None:
+        return {}
+
+    employment_type = posting.get("employmentType") or ""
+    if isinstance(employment_type, list):
+        employment_type = ", ".join(_text(item) for item in employment_type)
+
+    fields = {
+        "job_title": _text(posting.get("title")),
+        "company": _text(posting.get("hiringOrganization")),
+        "location": _location(posting),
+        "description_html": _description_html(posting),
+        "date_posted": _text(posting.get("datePosted")),
+        "valid_through": _text(posting.get("validThrough")),
+        "employment_type": _text(employment_type),
+        "salary": _salary(posting),
+    }
+    fields = {key: value for key, value in fields.items() if value}
+    if fields:
+        fields["source"] = source
+    return fields
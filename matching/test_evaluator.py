@@ -3,11 +3,44 @@ Day 7 Test - Job Matching & Evaluator
 Tests the Apply/Skip logic against sample data
 """
 
-from matching.evaluator import evaluate_job
+from matching.evaluator import JobEvaluator, evaluate_job
 import json
 import yaml
 from pathlib import Path
 
+
+def _comparison_jobs() -> list:
+    """Jobs covering every filter outcome, empty and odd titles included."""
+    titles = ["Machine Learning Engineer", "", "Senior ML Engineer", "Chef", "machine learning", "   "]
+    locations = ["Remote", "Bangalore, India", "Columbus, OH", ""]
+    companies = ["ABC Technologies", "SpamAgency", ""]
+    descriptions = [
+        "Python, SQL, Pandas, Scikit-learn and machine learning. 2+ years experience required.",
+        "Python and Docker. 8 years experience required.",
+        "No requirements listed.",
+    ]
+    return [
+        {"job_title": title, "location": location, "company": company, "description": description}
+        for title in titles for location in locations
+        for company in companies for description in descriptions
+    ]
+
+
+def test_evaluate_many_matches_evaluate():
+    """The batch path returns exactly the per-job decisions, in both modes."""
+    resume = {"skills": ["python", "machine learning", "sql", "pandas", "scikit-learn"],
+              "experience_years": 3.0, "location": "India"}
+    settings = {
+        "job": {"title": "Machine Learning Engineer"},
+        "experience": {"max_extra_years": 2},
+        "filters": {"min_title_match": 70, "min_skill_match": 2, "blocked_companies": ["SpamAgency"]},
+    }
+    jobs = _comparison_jobs()
+    for mode in ("fast", "explain"):
+        evaluator = JobEvaluator(resume, settings, workers=1, mode=mode)
+        assert evaluator.evaluate_many(jobs) == [evaluator.evaluate(job) for job in jobs]
+
+
 def main():
     print("=" * 50)
     print("Day 7 Test - Job Matching Engine")
@@ -0,0 +1,130 @@
+"""
+HTML Backend Test - Conformance and speed of clean_job_text backends
+
+Checks that every installed backend (selectolax, lxml) produces exactly
+the text of the reference BeautifulSoup backend, then times them all.
+
+Usage:
+    python matching/test_html_backends.py [--corpus DIR] [--repeat N]
+
+Without --corpus the benchmark uses data/sample_job.html padded to the
+size of a full job page (scripts, styles and repeated markup).
+
+Known differences (malformed markup only): each parser recovers from
+broken HTML in its own way (e.g. text misplaced inside <table>), and the
+HTML5 parsers turn a lone carriage return into a line break.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from matching.job_reader import available_backends, clean_job_text
+
+SAMPLE_HTML = Path("data/sample_job.html")
+
+# Approximate size of a full Indeed job page
+FULL_PAGE_BYTES = 300_000
+
+
+def full_page(html: str, size: int = FULL_PAGE_BYTES) -> str:
+    """Pad a job description page to the size of a full job page."""
+    head, _, body = html.partition("<body>")
+    filler = (
+        "<script>window._data = {" + "\"k\": \"v\", " * 200 + "};</script>\n"
+        "<style>.a { color: red; }</style>\n"
+        "<div class=\"nav\"><ul><li><a href=\"#\">Jobs</a></li><li>Companies</li></ul></div>\n"
+    )
+    repeats = max(1, (size - len(html)) // len(filler))
+    return head + "<body>" + filler * repeats + body
+
+
+def load_corpus(corpus_dir: Path) -> list:
+    """Read every .html file under a directory."""
+    return [path.read_text(encoding="utf-8", errors="replace")
+            for path in sorted(Path(corpus_dir).rglob("*.html"))]
+
+
+def check_conformance(pages: list) -> dict:
+    """
+    Compare every installed backend against the reference backend.
+
+    Returns:
+        dict: {backend: number of pages whose text differs}
+    """
+    expected = [clean_job_text(page, "bs4") for page in pages]
+    return {
+        backend: sum(clean_job_text(page, backend) != text for page, text in zip(pages, expected))
+        for backend in available_backends()
+    }
+
+
+def benchmark(pages: list, repeat: int = 3) -> dict:
+    """
+    Time each installed backend over the pages (best of repeat runs).
+
+    Returns:
+        dict: {backend: seconds per pass over all pages}
+    """
+    timings = {}
+    for backend in available_backends():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for page in pages:
+                clean_job_text(page, backend)
+            best = min(best, time.perf_counter() - start)
+        timings[backend] = best
+    return timings
+
+
+def test_backends_match_sample():
+    """Every installed backend reproduces the reference text of the sample page."""
+    html = SAMPLE_HTML.read_text(encoding="utf-8")
+    assert check_conformance([html, full_page(html)]) == dict.fromkeys(available_backends(), 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark clean_job_text backends")
+    parser.add_argument("--corpus", type=Path, help="Directory of saved job pages (*.html)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing runs per backend")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("🧪 clean_job_text HTML backends")
+    print("=" * 60)
+    print(f"\nInstalled: {', '.join(available_backends())}")
+
+    if args.corpus:
+        pages = load_corpus(args.corpus)
+        print(f"Corpus: {len(pages)} pages from {args.corpus}")
+    else:
+        pages = [full_page(SAMPLE_HTML.read_text(encoding="utf-8"))] * 20
+        print(f"Corpus: {SAMPLE_HTML} padded to {len(pages[0]) // 1000} KB, x{len(pages)}")
+
+    if not pages:
+        print("❌ No pages found")
+        return
+
+    print("\n📏 Conformance (pages differing from bs4):")
+    for backend, mismatches in check_conformance(pages).items():
+        status = "✅" if mismatches == 0 else "❌"
+        print(f"   {status} {backend}: {mismatches}/{len(pages)}")
+
+    print("\n⏱️  Benchmark (best of {}):".format(args.repeat))
+    timings = benchmark(pages, args.repeat)
+    total_mb = sum(len(page) for page in pages) / 1e6
+    for backend, seconds in timings.items():
+        speedup = timings["bs4"] / seconds
+        print(f"   {backend:<11} {seconds * 1000:8.1f} ms  {total_mb / seconds:6.1f} MB/s  x{speedup:.1f}")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
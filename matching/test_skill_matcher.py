@@ -0,0 +1,32 @@
+"""
+Skill Matcher Test - Spellings the token automaton treats alike
+
+Usage:
+    python -m pytest matching/test_skill_matcher.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from matching.skill_matcher import SkillMatcher, tokenize
+
+
+def test_dotted_skill_spellings():
+    """"node.js", "Node JS", "nodejs" and a dotted run all find node.js."""
+    matcher = SkillMatcher(["node.js", "python"])
+    for text in ("node.js", "Node JS", "nodejs", "NodeJS developer"):
+        assert matcher.find_skills(text) == {"node.js"}, text
+    assert matcher.find_skills("Python.Node.js") == {"python", "node.js"}
+
+
+def test_word_boundaries():
+    """Skills only match whole tokens; a leading dot stays part of a word."""
+    matcher = SkillMatcher(["go", "r", ".net", "c++", "scikit-learn"])
+    assert matcher.find_skills("google docker") == set()
+    assert matcher.find_skills("C++ and .NET, scikit learn") == {"c++", ".net", "scikit-learn"}
+    assert tokenize("Python.Node.js") == ["python", "node", "js"]
+    assert tokenize("Use .NET") == ["use", ".net"]
@@ -1,12 +1,157 @@
 """
 Memory Manager - Handles persistent agent memory of applied jobs.
 This prevents duplicate applications and enables safe resume/restart.
+
+The parsed memory file is kept in a module-level index (document +
+hash set of URLs) and only re-read when the file's mtime or size
+changes, so repeated lookups cost O(1) instead of a full JSON parse.
+
+Storage is a compacted snapshot (data/applied_jobs.json) plus an
+append-only journal (data/applied_jobs.journal.jsonl). Marking a job
+appends one line to the journal; once the journal passes
+JOURNAL_COMPACT_BYTES it is folded into the snapshot. Loading replays
+snapshot + journal, and a partially written journal line is dropped
+instead of corrupting the history.
+
+Jobs are identified by their canonical job key (portals/job_key.py);
+new entries are stored as canonical URLs without tracking parameters.
 """
 
 import json
+import os
 from pathlib import Path
 
+from portals.job_key import job_identity, canonical_job_url
+
 MEMORY_FILE = Path("data/applied_jobs.json")
+JOURNAL_FILE = Path("data/applied_jobs.journal.jsonl")
+
+JOURNAL_COMPACT_BYTES = 256 * 1024  # Fold journal into snapshot past this size
+JOURNAL_FSYNC = False               # fsync after every journal append
+
+# In-process index of the memory file
+_index = {
+    "signature": None,   # (mtime_ns, size) of snapshot and journal when read
+    "memory": None,      # Parsed memory document
+    "keys": set()        # Hash set of applied job keys
+}
+
+
+def _stat_signature(path: Path):
+    """
+    Get the (mtime, size) signature of a file.
+    
+    Returns:
+        Tuple (mtime_ns, size), or None if the file does not exist
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _file_signature():
+    """
+    Get the combined signature of the snapshot and the journal.
+    
+    Returns:
+        Tuple of the two file signatures
+    """
+    return (_stat_signature(MEMORY_FILE), _stat_signature(JOURNAL_FILE))
+
+
+def _set_index(memory: dict, signature):
+    """Replace the in-process index with a freshly loaded document."""
+    _index["memory"] = memory
+    _index["keys"] = {job_identity(url) for url in memory["applied_jobs"]}
+    _index["signature"] = signature
+
+
+def _replay_journal(memory: dict) -> int:
+    """
+    Apply journal entries on top of a snapshot document.
+    
+    A trailing line without a newline is the remains of an interrupted
+    append: it is ignored and truncated away so the next append starts
+    on a clean line.
+    
+    Args:
+        memory: Snapshot document, updated in place
+        
+    Returns:
+        Number of entries replayed
+    """
+    if not JOURNAL_FILE.exists():
+        return 0
+    
+    data = JOURNAL_FILE.read_bytes()
+    complete = data[:data.rfind(b"\n") + 1]
+    
+    if len(complete) != len(data):
+        with open(JOURNAL_FILE, "r+b") as f:
+            f.truncate(len(complete))
+    
+    seen = {job_identity(url) for url in memory["applied_jobs"]}
+    replayed = 0
+    
+    for line in complete.splitlines():
+        try:
+            url = json.loads(line)["url"]
+        except (ValueError, KeyError, TypeError):
+            continue
+        key = job_identity(url)
+        if key not in seen:
+            seen.add(key)
+            memory["applied_jobs"].append(url)
+            replayed += 1
+    
+    return replayed
+
+
+def _write_snapshot(memory: dict):
+    """Atomically replace the snapshot file."""
+    tmp_file = MEMORY_FILE.with_name(MEMORY_FILE.name + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        f.write(json.dumps(memory, indent=2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, MEMORY_FILE)
+
+
+def _get_index() -> dict:
+    """
+    Get the in-process index, reloading it if the files changed on disk.
+    
+    Returns:
+        The index dictionary
+    """
+    signature = _file_signature()
+    
+    if _index["memory"] is None or signature != _index["signature"]:
+        if signature[0] is None:
+            memory = {"applied_jobs": []}
+        else:
+            memory = json.loads(MEMORY_FILE.read_text(encoding="utf-8"))
+        _replay_journal(memory)
+        _set_index(memory, _file_signature())
+    
+    return _index
+
+
+def compact_memory():
+    """
+    Fold the journal into the snapshot and truncate the journal.
+    
+    The snapshot is replaced atomically before the journal is cleared,
+    so a crash in between only leaves entries that replay as no-ops.
+    """
+    memory = _get_index()["memory"]
+    _write_snapshot(memory)
+    if JOURNAL_FILE.exists():
+        with open(JOURNAL_FILE, "r+b") as f:
+            f.truncate(0)
+    _index["signature"] = _file_signature()
 
 
 def load_memory() -> dict:
@@ -16,22 +161,25 @@ def load_memory() -> dict:
     Returns:
         Dictionary containing applied jobs list
     """
-    if not MEMORY_FILE.exists():
-        return {"applied_jobs": []}
-
-    return json.loads(MEMORY_FILE.read_text(encoding="utf-8"))
+    memory = _get_index()["memory"]
+    # Hand out a copy so callers cannot mutate the cached document
+    return {**memory, "applied_jobs": list(memory["applied_jobs"])}
 
 
 def save_memory(memory: dict):
     """
-    Save the agent's memory to disk.
+    Save the agent's memory to disk, replacing snapshot and journal.
     
     Args:
         memory: Dictionary containing applied jobs list
     """
-    MEMORY_FILE.write_text(
-        json.dumps(memory, indent=2),
-        encoding="utf-8"
+    _write_snapshot(memory)
+    if JOURNAL_FILE.exists():
+        with open(JOURNAL_FILE, "r+b") as f:
+            f.truncate(0)
+    _set_index(
+        {**memory, "applied_jobs": list(memory["applied_jobs"])},
+        _file_signature()
     )
 
 
@@ -39,27 +187,48 @@ def job_already_applied(job_url: str) -> bool:
     """
     Check if a job has already been applied to.
     
+    Any URL variant of the same posting matches (compared by job key).
+    
     Args:
         job_url: URL of the job posting
         
     Returns:
         True if already applied, False otherwise
     """
-    memory = load_memory()
-    return job_url in memory["applied_jobs"]
+    return job_identity(job_url) in _get_index()["keys"]
 
 
-def mark_job_applied(job_url: str):
+def mark_job_applied(job_url: str, fsync: bool = JOURNAL_FSYNC):
     """
     Mark a job as applied to prevent re-application.
     
+    Appends a single line to the journal (O(1) regardless of history
+    size) and compacts once the journal grows past the threshold.
+    
     Args:
         job_url: URL of the job posting
+        fsync: Force the journal line to disk before returning
     """
-    memory = load_memory()
-    if job_url not in memory["applied_jobs"]:
-        memory["applied_jobs"].append(job_url)
-        save_memory(memory)
+    index = _get_index()
+    key = job_identity(job_url)
+    if key in index["keys"]:
+        return
+    
+    job_url = canonical_job_url(job_url)
+    line = json.dumps({"url": job_url}) + "\n"
+    with open(JOURNAL_FILE, "a", encoding="utf-8") as f:
+        f.write(line)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    
+    index["memory"]["applied_jobs"].append(job_url)
+    index["keys"].add(key)
+    index["signature"] = _file_signature()
+    
+    journal_size = index["signature"][1][1] if index["signature"][1] else 0
+    if journal_size > JOURNAL_COMPACT_BYTES:
+        compact_memory()
 
 
 def get_applied_count() -> int:
@@ -69,8 +238,30 @@ def get_applied_count() -> int:
     Returns:
         Number of jobs in memory
     """
+    return len(_get_index()["memory"]["applied_jobs"])
+
+
+def migrate_job_keys() -> int:
+    """
+    Re-key stored history: rewrite every entry as its canonical URL
+    and drop entries that point at the same job key.
+    
+    Returns:
+        Number of duplicate entries removed
+    """
     memory = load_memory()
-    return len(memory["applied_jobs"])
+    
+    canonical = []
+    seen = set()
+    for url in memory["applied_jobs"]:
+        key = job_identity(url)
+        if key not in seen:
+            seen.add(key)
+            canonical.append(canonical_job_url(url))
+    
+    removed = len(memory["applied_jobs"]) - len(canonical)
+    save_memory({**memory, "applied_jobs": canonical})
+    return removed
 
 
 def clear_memory():
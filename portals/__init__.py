@@ -3,4 +3,5 @@ Portals Package - Job Portal Automation Modules
 
 Contains automation logic for different job portals:
 - indeed.py: Indeed job search and link collection
+- job_key.py: Canonical job keys for deduplicating Indeed URLs
 """
@@ -12,6 +12,9 @@ DAY 10: Read-only automation - NO Apply clicks!
 from urllib.parse import quote
 import time
 
+from portals.job_key import job_identity, canonical_job_url
+from app_logging.seen_filter import was_seen
+
 
 def build_search_url(title: str, location: str, days: int = 7) -> str:
     """
@@ -30,7 +33,7 @@ def build_search_url(title: str, location: str, days: int = 7) -> str:
     return base + params
 
 
-def collect_job_links(page, max_jobs: int = 20) -> list:
+def collect_job_links(page, max_jobs: int = 20, skip_seen: bool = True) -> list:
     """
     Collect job listing URLs from Indeed search results.
     
@@ -40,11 +43,15 @@ def collect_job_links(page, max_jobs: int = 20) -> list:
     Args:
         page: Playwright page object
         max_jobs: Maximum number of job links to collect
+        skip_seen: Skip jobs that were already read or evaluated
     
     Returns:
-        List of unique job URLs
+        List of unique job URLs, one canonical URL per job key
     """
-    job_links = set()
+    # Keyed by job key so tracking-parameter variants of the same
+    # posting collapse into a single link
+    job_links = {}
+    skipped = set()
     
     print(f"🔍 Collecting up to {max_jobs} job links...")
 
@@ -78,9 +85,18 @@ def collect_job_links(page, max_jobs: int = 20) -> list:
                     # Build full URL if relative
                     if href.startswith("/viewjob") or href.startswith("/rc/"):
                         full_url = "https://www.indeed.com" + href
-                        job_links.add(full_url)
                     elif "indeed.com" in href and ("/viewjob" in href or "/rc/" in href):
-                        job_links.add(href)
+                        full_url = href
+                    else:
+                        continue
+                    
+                    job_key = job_identity(full_url)
+                    if job_key in job_links or job_key in skipped:
+                        continue
+                    if skip_seen and was_seen(full_url):
+                        skipped.add(job_key)
+                        continue
+                    job_links[job_key] = canonical_job_url(full_url)
             except Exception as e:
                 print(f"  ⚠️ Error extracting href: {e}")
                 continue
@@ -99,7 +115,10 @@ def collect_job_links(page, max_jobs: int = 20) -> list:
             print(f"  ✅ Reached max jobs limit ({max_jobs})")
             break
 
-    return list(job_links)[:max_jobs]
+    if skipped:
+        print(f"  ⏭️ Skipped {len(skipped)} jobs seen in earlier sessions")
+
+    return list(job_links.values())[:max_jobs]
 
 
 def save_job_links(links: list, filename: str = "data/job_links.txt") -> None:
@@ -5,6 +5,7 @@ DAY 11: Opens real job URLs and builds structured job profiles
 for decision-making and auto-apply pipeline.
 """
 
+import sqlite3
 import sys
 from pathlib import Path
 import time
@@ -14,19 +15,39 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from matching.job_reader import build_job_profile
+from portals.job_key import job_identity
+from portals.page_archive import get_archive
+from app_logging.seen_filter import was_seen
 
 
-def read_job_page(page, job_url: str) -> dict:
+def read_job_page(page, job_url: str, skip_seen: bool = True) -> dict:
     """
     Read a live Indeed job page and extract job profile.
     
     Args:
         page: Playwright page object
         job_url: URL of the job posting
+        skip_seen: Don't navigate to jobs that were already read
     
     Returns:
-        Dictionary containing job profile with url
+        Dictionary containing job profile with url and job_key.
+        Jobs seen before are returned with "skipped": True and no
+        page load. The job is not marked seen here: the caller marks it
+        (mark_seen) once the profile is saved, so a crash before that or
+        a blocked page leaves it to be read again.
     """
+    if skip_seen and was_seen(job_url):
+        print(f"⏭️ Already seen, skipping: {job_url[:60]}")
+        return {
+            "job_title": "",
+            "company": "",
+            "location": "",
+            "description": "",
+            "url": job_url,
+            "job_key": job_identity(job_url),
+            "skipped": True
+        }
+    
     print(f"📄 Reading job page: {job_url[:60]}...")
 
     try:
@@ -36,9 +57,18 @@ def read_job_page(page, job_url: str) -> dict:
         # Get page HTML
         html = page.content()
         
+        # Keep the raw page so extraction can be redone offline
+        try:
+            digest = get_archive().put(job_url, html)
+        except (OSError, sqlite3.Error) as e:
+            print(f"  ⚠️ Could not archive page (non-fatal): {e}")
+            digest = None
+        
         # Build job profile using Day 6 job_reader
         job = build_job_profile(html)
         job["url"] = job_url
+        job["job_key"] = job_identity(job_url)
+        job["archive_digest"] = digest
         
         # Try to extract Indeed-specific fields using selectors
         job = enhance_job_profile_from_indeed(page, job)
@@ -53,16 +83,46 @@ def read_job_page(page, job_url: str) -> dict:
             "location": "",
             "description": "",
             "url": job_url,
+            "job_key": job_identity(job_url),
             "error": str(e)
         }
 
 
+# Indeed selectors per field, tried in order, with the minimum text length
+# a match needs to be accepted
+FIELD_SELECTORS = {
+    "job_title": ([
+        "h1.jobsearch-JobInfoHeader-title",
+        "h1[data-testid='jobsearch-JobInfoHeader-title']",
+        ".jobsearch-JobInfoHeader-title-container h1",
+        "h1"
+    ], 4),
+    "company": ([
+        "[data-testid='inlineHeader-companyName'] a",
+        "[data-testid='inlineHeader-companyName']",
+        ".jobsearch-InlineCompanyRating-companyHeader a",
+        ".jobsearch-InlineCompanyRating a"
+    ], 2),
+    "location": ([
+        "[data-testid='inlineHeader-companyLocation']",
+        ".jobsearch-JobInfoHeader-subtitle div:last-child",
+        "[data-testid='job-location']"
+    ], 2),
+    "description": ([
+        "#jobDescriptionText",
+        ".jobsearch-jobDescriptionText",
+        "[id='jobDescriptionText']"
+    ], 101),
+}
+
+
 def enhance_job_profile_from_indeed(page, job: dict) -> dict:
     """
     Enhance job profile with Indeed-specific selectors.
     
     Indeed has structured elements we can directly target
-    for more accurate extraction.
+    for more accurate extraction. Fields already taken from the page's
+    JSON-LD / microdata (job["structured_fields"]) are not looked up.
     
     Args:
         page: Playwright page object
@@ -71,76 +131,22 @@ def enhance_job_profile_from_indeed(page, job: dict) -> dict:
     Returns:
         Enhanced job profile
     """
+    structured = set(job.get("structured_fields", ()))
+    
     try:
-        # Try Indeed-specific selectors for job title
-        title_selectors = [
-            "h1.jobsearch-JobInfoHeader-title",
-            "h1[data-testid='jobsearch-JobInfoHeader-title']",
-            ".jobsearch-JobInfoHeader-title-container h1",
-            "h1"
-        ]
-        for selector in title_selectors:
-            try:
-                element = page.query_selector(selector)
-                if element:
-                    title = element.inner_text().strip()
-                    if title and len(title) > 3:
-                        job["job_title"] = title
-                        break
-            except:
-                continue
-        
-        # Try Indeed-specific selectors for company
-        company_selectors = [
-            "[data-testid='inlineHeader-companyName'] a",
-            "[data-testid='inlineHeader-companyName']",
-            ".jobsearch-InlineCompanyRating-companyHeader a",
-            ".jobsearch-InlineCompanyRating a"
-        ]
-        for selector in company_selectors:
-            try:
-                element = page.query_selector(selector)
-                if element:
-                    company = element.inner_text().strip()
-                    if company and len(company) > 1:
-                        job["company"] = company
-                        break
-            except:
-                continue
-        
-        # Try Indeed-specific selectors for location
-        location_selectors = [
-            "[data-testid='inlineHeader-companyLocation']",
-            ".jobsearch-JobInfoHeader-subtitle div:last-child",
-            "[data-testid='job-location']"
-        ]
-        for selector in location_selectors:
-            try:
-                element = page.query_selector(selector)
-                if element:
-                    location = element.inner_text().strip()
-                    if location and len(location) > 1:
-                        job["location"] = location
-                        break
-            except:
-                continue
-        
-        # Try Indeed-specific selectors for job description
-        desc_selectors = [
-            "#jobDescriptionText",
-            ".jobsearch-jobDescriptionText",
-            "[id='jobDescriptionText']"
-        ]
-        for selector in desc_selectors:
-            try:
-                element = page.query_selector(selector)
-                if element:
-                    desc = element.inner_text().strip()
-                    if desc and len(desc) > 100:
-                        job["description"] = desc
-                        break
-            except:
+        for field, (selectors, min_length) in FIELD_SELECTORS.items():
+            if field in structured:
                 continue
+            for selector in selectors:
+                try:
+                    element = page.query_selector(selector)
+                    if element:
+                        value = element.inner_text().strip()
+                        if value and len(value) >= min_length:
+                            job[field] = value
+                            break
+                except:
+                    continue
                 
     except Exception as e:
         print(f"  ⚠️ Enhancement error (non-fatal): {e}")
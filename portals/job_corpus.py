@@ -0,0 +1,184 @@
+"""
+Job Corpus - Streaming JSONL storage of scraped job profiles
+
+One JSON object per line, written and flushed as each job page is read,
+so a crash mid-scrape keeps every job read so far. Readers iterate the
+file lazily; memory use does not grow with the corpus.
+
+The compression follows the file suffix:
+- .jsonl      plain text
+- .jsonl.gz   gzip
+- .jsonl.zst  zstandard (needs the optional zstandard package)
+
+A truncated last line or compressed block (from an interrupted write) is
+skipped when reading, as is (and counted) any other malformed line.
+Appending to a plain .jsonl first cuts a partial last line off, so the
+next job starts on a clean line. The legacy data/jobs_raw.json array is
+still read.
+"""
+
+import gzip
+import io
+import json
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+JOBS_CORPUS = Path("data/jobs_raw.jsonl")
+
+# Corpus files run_evaluation looks for; the newest one wins
+CORPUS_CANDIDATES = (
+    Path("data/jobs_raw.jsonl"),
+    Path("data/jobs_raw.jsonl.gz"),
+    Path("data/jobs_raw.jsonl.zst"),
+    Path("data/jobs_raw.json"),
+)
+
+# Read backwards in blocks when looking for the last newline
+TAIL_BLOCK = 1 << 16
+
+# Errors raised when a compressed stream ends mid-block
+TRUNCATION_ERRORS = (EOFError,) + ((zstandard.ZstdError,) if zstandard else ())
+
+
+def _require_zstandard():
+    """Fail with an install hint when zstandard is missing."""
+    if zstandard is None:
+        raise ImportError("Reading/writing .zst corpora needs: pip install zstandard")
+
+
+def open_corpus(path: Path, mode: str = "r"):
+    """
+    Open a corpus file as text, choosing compression by suffix.
+
+    Args:
+        path: Corpus path
+        mode: "r" to read, "w" to write, "a" to append
+
+    Returns:
+        Text file object
+    """
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if path.suffix == ".zst":
+        _require_zstandard()
+        raw = open(path, mode + "b")
+        if mode == "r":
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        else:
+            stream = zstandard.ZstdCompressor().stream_writer(raw)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _truncate_partial_line(path: Path):
+    """
+    Cut an interrupted append (text after the last newline) off a file.
+
+    Only the tail of the file is read, block by block from the end.
+    """
+    with open(path, "r+b") as f:
+        end = f.seek(0, io.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - TAIL_BLOCK)
+            f.seek(start)
+            newline = f.read(position - start).rfind(b"\n")
+            if newline != -1:
+                keep = start + newline + 1
+                break
+            position = start
+        else:
+            keep = 0
+        if keep != end:
+            f.truncate(keep)
+
+
+class JobCorpusWriter:
+    """
+    Append-as-you-go writer for a job corpus.
+
+    Usage:
+        with JobCorpusWriter() as corpus:
+            corpus.write(job)      # durable once write() returns
+    """
+
+    def __init__(self, path: Path = JOBS_CORPUS, append: bool = False):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        # Compressed corpora cannot be cut mid-stream; readers skip their bad tail
+        if append and self.path.suffix == ".jsonl" and self.path.exists():
+            _truncate_partial_line(self.path)
+        self._file = open_corpus(self.path, "a" if append else "w")
+
+    def write(self, job: dict):
+        """Write one job and flush it to disk."""
+        self._file.write(json.dumps(job, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def iter_jobs(path: Path = JOBS_CORPUS, stats: dict = None):
+    """
+    Lazily iterate the jobs of a corpus.
+
+    Args:
+        path: Corpus path (.jsonl, .jsonl.gz, .jsonl.zst or legacy .json)
+        stats: Optional dict; the number of skipped malformed lines is
+            added to stats["malformed"]
+
+    Yields:
+        Job profile dictionaries, in file order
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        # Legacy single-array format; has to be loaded whole
+        with open(path, encoding="utf-8") as f:
+            yield from json.load(f)
+        return
+
+    malformed = 0
+    with open_corpus(path) as f:
+        try:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    job = json.loads(line)
+                except json.JSONDecodeError:
+                    # Cut off mid-write, or joined onto such a line
+                    malformed += 1
+                    continue
+                yield job
+        except TRUNCATION_ERRORS:
+            pass
+        finally:
+            if stats is not None:
+                stats["malformed"] = stats.get("malformed", 0) + malformed
+
+
+def find_corpus():
+    """
+    Find the job corpus to evaluate.
+
+    Returns:
+        Path of the most recently written corpus file, or None
+    """
+    existing = [path for path in CORPUS_CANDIDATES if path.exists()]
+    if not existing:
+        return None
+    return max(existing, key=lambda path: path.stat().st_mtime)
@@ -0,0 +1,79 @@
+"""
+Job Key - Canonical identity for Indeed job URLs
+
+The same Indeed posting shows up under many URLs that differ only by
+tracking parameters, e.g.:
+    /rc/clk?jk=17b4b9513dafe45a&bb=...&from=serp
+    /viewjob?jk=17b4b9513dafe45a&vjs=3
+    /jobs?q=ml&vjk=17b4b9513dafe45a
+
+All of them reduce to the job key (jk). The key is the dedup identity
+used by link collection, the job reader, the apply queue and both
+memory stores.
+"""
+
+import re
+from urllib.parse import urlparse, parse_qs
+
+INDEED_BASE = "https://www.indeed.com"
+
+# Query parameters that carry the job key, in order of preference
+JOB_KEY_PARAMS = ("jk", "vjk")
+
+JOB_KEY_PATTERN = re.compile(r"[0-9A-Za-z]{8,32}")
+
+
+def extract_job_key(url: str) -> str:
+    """
+    Extract the Indeed job key from a job URL.
+    
+    Args:
+        url: Absolute or relative Indeed job URL
+    
+    Returns:
+        Lowercase job key, or empty string if the URL has none
+    """
+    if not url:
+        return ""
+    
+    parsed = urlparse(url.strip())
+    if parsed.netloc and "indeed." not in parsed.netloc.lower():
+        return ""
+    
+    params = parse_qs(parsed.query)
+    for name in JOB_KEY_PARAMS:
+        values = params.get(name)
+        if values and JOB_KEY_PATTERN.fullmatch(values[0]):
+            return values[0].lower()
+    
+    return ""
+
+
+def job_identity(url: str) -> str:
+    """
+    Get the dedup identity of a job URL.
+    
+    Args:
+        url: Job URL
+    
+    Returns:
+        The job key for Indeed URLs, otherwise the stripped URL itself
+    """
+    return extract_job_key(url) or (url or "").strip()
+
+
+def canonical_job_url(url: str) -> str:
+    """
+    Reduce a job URL to its canonical form without tracking parameters.
+    
+    Args:
+        url: Job URL
+    
+    Returns:
+        https://www.indeed.com/viewjob?jk=<key> for Indeed URLs,
+        otherwise the stripped URL unchanged
+    """
+    key = extract_job_key(url)
+    if key:
+        return f"{INDEED_BASE}/viewjob?jk={key}"
+    return (url or "").strip()
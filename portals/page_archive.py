@@ -0,0 +1,257 @@
+"""
+Page Archive - Content-addressed store of fetched job page HTML
+
+Every page read_job_page fetches is kept, so extractor changes can be
+re-run offline instead of re-scraping:
+- pages are stored once per SHA-256 of their HTML under
+  data/html_archive/objects/<2 hex>/<digest>.html.zst (zstandard when
+  installed, else .html.gz); identical pages share one object
+- data/html_archive/index.db maps each URL (and its job key) to the
+  digest of its latest fetch
+
+Usage:
+    python portals/page_archive.py stats
+    python portals/page_archive.py reparse [--workers N] [--output data/jobs_raw.jsonl]
+
+reparse rebuilds the job corpus from the archive on all cores; each
+distinct page is parsed once, however many URLs point at it. It is
+matching/reextract.py run on the archive (see there for saved-page
+directories and the timing report).
+"""
+
+import argparse
+import atexit
+import gzip
+import hashlib
+import os
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from portals.job_corpus import JOBS_CORPUS
+from portals.job_key import job_identity
+
+ARCHIVE_DIR = Path(__file__).parent.parent / "data" / "html_archive"
+
+# New objects use the best installed codec; both are always readable
+OBJECT_SUFFIXES = (".html.zst", ".html.gz")
+WRITE_SUFFIX = ".html.zst" if zstandard else ".html.gz"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    job_key TEXT,
+    digest TEXT NOT NULL,
+    fetched_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pages_digest ON pages(digest);
+"""
+
+SQL_UPSERT_PAGE = (
+    "INSERT INTO pages (url, job_key, digest, fetched_at) VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (url) DO UPDATE SET job_key = excluded.job_key, "
+    "digest = excluded.digest, fetched_at = excluded.fetched_at"
+)
+SQL_DIGEST_FOR_URL = "SELECT digest FROM pages WHERE url = ?"
+SQL_PAGES_BY_DIGEST = "SELECT digest, url, job_key FROM pages ORDER BY digest, url"
+
+
+def _compress(data: bytes, suffix: str) -> bytes:
+    """Compress an object with the codec its suffix names."""
+    if suffix == ".html.zst":
+        return zstandard.ZstdCompressor(level=10).compress(data)
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data: bytes, suffix: str) -> bytes:
+    """Decompress an object with the codec its suffix names."""
+    if suffix == ".html.zst":
+        if zstandard is None:
+            raise ImportError("Reading .zst archive objects needs: pip install zstandard")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+def page_digest(html: str) -> str:
+    """SHA-256 hex digest of a page's HTML (UTF-8)."""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+def object_path(digest: str, suffix: str = WRITE_SUFFIX, root: Path = ARCHIVE_DIR) -> Path:
+    """Path of the object file for a digest."""
+    return Path(root) / "objects" / digest[:2] / (digest + suffix)
+
+
+def load_page(digest: str, root: Path = ARCHIVE_DIR) -> str:
+    """
+    Read an archived page by digest.
+
+    Needs no database connection, so worker processes can call it.
+
+    Args:
+        digest: SHA-256 hex digest of the page
+        root: Archive directory
+
+    Returns:
+        Page HTML
+
+    Raises:
+        FileNotFoundError: If no object exists for the digest
+    """
+    for suffix in OBJECT_SUFFIXES:
+        path = object_path(digest, suffix, root)
+        if path.exists():
+            return _decompress(path.read_bytes(), suffix).decode("utf-8")
+    raise FileNotFoundError(f"No archived page for digest {digest}")
+
+
+class PageArchive:
+    """
+    Content-addressed page store with a URL index.
+
+    Usage:
+        archive = PageArchive()
+        digest = archive.put(url, html)
+        html = archive.get(archive.digest_for(url))
+    """
+
+    def __init__(self, root: Path = ARCHIVE_DIR):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.root / "index.db"))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def has_object(self, digest: str) -> bool:
+        """True if the page is already stored (in any codec)."""
+        return any(object_path(digest, suffix, self.root).exists() for suffix in OBJECT_SUFFIXES)
+
+    def put(self, url: str, html: str) -> str:
+        """
+        Archive a fetched page and point its URL at it.
+
+        Args:
+            url: URL the page was fetched from
+            html: Page HTML
+
+        Returns:
+            str: Digest of the page
+        """
+        digest = page_digest(html)
+
+        if not self.has_object(digest):
+            path = object_path(digest, WRITE_SUFFIX, self.root)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(_compress(html.encode("utf-8"), WRITE_SUFFIX))
+            os.replace(tmp_path, path)
+
+        with self.conn:
+            self.conn.execute(
+                SQL_UPSERT_PAGE,
+                (url, job_identity(url), digest, datetime.now().isoformat())
+            )
+        return digest
+
+    def get(self, digest: str) -> str:
+        """Read an archived page by digest."""
+        return load_page(digest, self.root)
+
+    def digest_for(self, url: str):
+        """
+        Digest of the latest archived fetch of a URL.
+
+        Returns:
+            str or None
+        """
+        row = self.conn.execute(SQL_DIGEST_FOR_URL, (url,)).fetchone()
+        return row[0] if row else None
+
+    def iter_pages(self):
+        """
+        Iterate the index grouped by page.
+
+        Yields:
+            (digest, [(url, job_key), ...]) per distinct page
+        """
+        current, entries = None, []
+        for digest, url, job_key in self.conn.execute(SQL_PAGES_BY_DIGEST):
+            if digest != current and entries:
+                yield current, entries
+                entries = []
+            current = digest
+            entries.append((url, job_key))
+        if entries:
+            yield current, entries
+
+    def stats(self) -> dict:
+        """
+        Size of the archive.
+
+        Returns:
+            dict: urls, pages (distinct objects) and bytes on disk
+        """
+        urls, pages = self.conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT digest) FROM pages"
+        ).fetchone()
+        size = sum(path.stat().st_size for path in (self.root / "objects").rglob("*.html.*"))
+        return {"urls": urls, "pages": pages, "bytes": size}
+
+    def close(self):
+        self.conn.close()
+
+
+_archive = None
+
+
+def get_archive() -> PageArchive:
+    """
+    Open (once per process) the shared page archive.
+
+    Returns:
+        PageArchive: Archive under data/html_archive
+    """
+    global _archive
+    if _archive is None:
+        _archive = PageArchive()
+        atexit.register(_archive.close)
+    return _archive
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Raw job page archive")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="Show archive size")
+    reparse_parser = commands.add_parser("reparse", help="Rebuild the job corpus from archived pages")
+    reparse_parser.add_argument("--workers", type=int, default=None,
+                                help="Worker processes (default: all cores)")
+    reparse_parser.add_argument("--output", type=Path, default=JOBS_CORPUS,
+                                help=f"Corpus to write (default: {JOBS_CORPUS})")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        stats = get_archive().stats()
+        print(f"🗄️  {stats['urls']} URLs → {stats['pages']} pages, {stats['bytes'] / 1e6:.1f} MB")
+        return
+
+    # Imported here: the re-extraction engine itself reads this archive
+    from matching.reextract import archive_tasks, print_report, reextract
+
+    print(f"🔁 Re-extracting job profiles from {ARCHIVE_DIR} ...")
+    stats = reextract(archive_tasks(), args.output, args.workers)
+    print_report(stats, args.output)
+
+
+if __name__ == "__main__":
+    main()
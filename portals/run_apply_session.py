@@ -9,6 +9,7 @@ Features:
 - Session limits
 - Human confirmation for each job
 - Session summary
+- Per-job resume variant (chosen during evaluation) for filling and upload
 
 ⚠️ SAFE LIMITS: Max 3 jobs per session by default
 """
@@ -34,6 +35,7 @@ from automation.submitter import submit_application, click_continue_buttons
 from automation.success_detector import detect_success, take_confirmation_screenshot
 from app_logging.memory import mark_job_applied, is_job_applied, print_application_summary
 from app_logging.sheets_logger import log_application
+from resume.library import DEFAULT_VARIANT, ResumeLibrary
 
 
 # ============================================================
@@ -58,10 +60,28 @@ def load_resume() -> dict:
     return json.load(open("data/resume_profile.json", encoding="utf-8"))
 
 
-def apply_to_job(browser, job: dict, resume: dict, job_num: int) -> dict:
+def resume_for_job(job: dict, library: ResumeLibrary, default_resume: dict) -> tuple:
+    """
+    Resume profile and PDF to apply to a job with.
+    
+    Returns:
+        (profile, pdf path): the job's chosen variant, else the default resume
+    """
+    variant = library.get(job["resume_variant"]) if "resume_variant" in job else None
+    if variant is None:
+        return default_resume, "resume/resume.pdf"
+    return variant.profile, str(variant.path)
+
+
+def apply_to_job(browser, job: dict, resume: dict, job_num: int,
+                 resume_path: str = "resume/resume.pdf") -> dict:
     """
     Apply to a single job.
     
+    Args:
+        resume: Resume profile used to fill the form
+        resume_path: Resume PDF to upload
+    
     Returns:
         dict: Result with success status
     """
@@ -98,7 +118,7 @@ def apply_to_job(browser, job: dict, resume: dict, job_num: int) -> dict:
             filled = autofill_personal_info(browser.page, resume)
             
             # Resume upload
-            handle_resume_upload(browser.page)
+            handle_resume_upload(browser.page, resume_path)
             
             # Cover letter
             handle_cover_letter_any_method(browser.page)
@@ -154,6 +174,7 @@ def main():
         return
     
     resume = load_resume()
+    library = ResumeLibrary()
     
     # Filter out already applied jobs
     pending_jobs = [j for j in jobs if not is_job_applied(j.get("url", ""))]
@@ -217,8 +238,11 @@ def main():
                     print("⏭️ Skipping this job")
                     continue
             
-            # Apply to job
-            result = apply_to_job(browser, job, resume, i + 1)
+            # Apply to job with its resume variant
+            job_resume, resume_path = resume_for_job(job, library, resume)
+            if job.get("resume_variant", DEFAULT_VARIANT) != DEFAULT_VARIANT:
+                print(f"   Resume: {job['resume_variant']} ({resume_path})")
+            result = apply_to_job(browser, job, job_resume, i + 1, resume_path)
             session_results.append(result)
             
             if result["success"]:
@@ -271,6 +295,7 @@ def main():
                 {
                     "job_title": r["job"].get("job_title"),
                     "company": r["job"].get("company"),
+                    "resume_variant": r["job"].get("resume_variant", DEFAULT_VARIANT),
                     "success": r["success"],
                     "reason": r["reason"]
                 }
@@ -5,21 +5,23 @@ This script:
 1. Reads job URLs from data/job_links.txt
 2. Opens each job page in the browser
 3. Extracts job details (title, company, location, description)
-4. Saves all jobs to data/jobs_raw.json
+4. Appends each job to data/jobs_raw.jsonl as soon as it is read
 
 ⚠️ READ-ONLY AUTOMATION - NO Apply clicks!
 """
 
 import sys
 from pathlib import Path
-import json
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from app_logging.seen_filter import mark_seen
 from automation.browser import Browser
 from portals.indeed_reader import read_job_page
+from portals.job_corpus import JOBS_CORPUS, JobCorpusWriter
+from portals.job_key import job_identity
 
 
 def main():
@@ -38,6 +40,12 @@ def main():
     with open(job_links_file, "r", encoding="utf-8") as f:
         job_links = [line.strip() for line in f if line.strip()]
     
+    # One page load per job key, not per tracking-URL variant
+    unique_links = {}
+    for link in job_links:
+        unique_links.setdefault(job_identity(link), link)
+    job_links = list(unique_links.values())
+    
     print(f"\n📋 Found {len(job_links)} job links")
     
     # Limit to first 10 for safety (avoid rate limiting)
@@ -50,7 +58,12 @@ def main():
     browser = Browser(headless=False)
     browser.start()
 
-    jobs = []
+    # Each job is on disk as soon as it is read; appending keeps the jobs
+    # of earlier runs (and of a crashed one) that are now skipped as seen
+    output_file = JOBS_CORPUS
+    corpus = JobCorpusWriter(output_file, append=True)
+    successful = 0
+    failed = 0
     
     print("\n" + "-" * 60)
     for idx, link in enumerate(job_links, 1):
@@ -58,7 +71,17 @@ def main():
         
         try:
             job = read_job_page(browser.page, link)
-            jobs.append(job)
+            if job.get("skipped"):
+                continue
+            corpus.write(job)
+            # Seen only once saved, and only if the page was a real job
+            # page (block and captcha pages have neither field)
+            if job.get("job_title") or job.get("description"):
+                mark_seen(link, "read")
+            if job.get("job_title"):
+                successful += 1
+            else:
+                failed += 1
             
             # Display extracted info
             title = job.get('job_title', 'Unknown')[:40]
@@ -76,7 +99,8 @@ def main():
             
         except Exception as e:
             print(f"   ❌ Failed: {e}")
-            jobs.append({
+            failed += 1
+            corpus.write({
                 "job_title": "",
                 "company": "",
                 "location": "",
@@ -87,19 +111,13 @@ def main():
     
     print("\n" + "-" * 60)
 
+    corpus.close()
+
     # Close browser
     print("\n🔒 Closing browser...")
     browser.stop()
 
-    # Save jobs to JSON
-    output_file = Path("data/jobs_raw.json")
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(jobs, f, indent=2, ensure_ascii=False)
-
     # Summary
-    successful = sum(1 for j in jobs if j.get('job_title'))
-    failed = len(jobs) - successful
-    
     print("\n" + "=" * 60)
     print(f"📊 Results Summary:")
     print(f"   ✅ Successfully extracted: {successful} jobs")
@@ -0,0 +1,67 @@
+"""
+Job Corpus Test - Appending to and reading back an interrupted corpus
+
+Usage:
+    python -m pytest portals/test_job_corpus.py
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from portals.job_corpus import JobCorpusWriter, iter_jobs
+
+
+def _job(number: int) -> dict:
+    return {"job_title": f"Engineer {number}", "url": f"https://example.com/{number}"}
+
+
+def test_append_repairs_cut_off_line(tmp_path):
+    """Appending after a crash mid-write keeps every complete job."""
+    path = tmp_path / "jobs_raw.jsonl"
+    with JobCorpusWriter(path) as corpus:
+        corpus.write(_job(1))
+        corpus.write(_job(2))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(_job(3))[:20])   # Interrupted write
+
+    with JobCorpusWriter(path, append=True) as corpus:
+        corpus.write(_job(4))
+
+    stats = {}
+    assert list(iter_jobs(path, stats)) == [_job(1), _job(2), _job(4)]
+    assert stats["malformed"] == 0
+
+
+def test_append_keeps_earlier_runs(tmp_path):
+    """A second run appends; it does not truncate the corpus."""
+    path = tmp_path / "jobs_raw.jsonl"
+    with JobCorpusWriter(path, append=True) as corpus:
+        corpus.write(_job(1))
+    with JobCorpusWriter(path, append=True) as corpus:
+        corpus.write(_job(2))
+    assert [job["job_title"] for job in iter_jobs(path)] == ["Engineer 1", "Engineer 2"]
+
+
+def test_malformed_lines_skipped_and_counted(tmp_path):
+    """Bad lines anywhere are skipped; a truncated gzip tail ends the read."""
+    path = tmp_path / "jobs_raw.jsonl"
+    path.write_text(json.dumps(_job(1)) + "\n{not json\n\n" + json.dumps(_job(2)) + "\n",
+                    encoding="utf-8")
+    stats = {}
+    assert list(iter_jobs(path, stats)) == [_job(1), _job(2)]
+    assert stats["malformed"] == 1
+
+    gz_path = tmp_path / "jobs_raw.jsonl.gz"
+    with JobCorpusWriter(gz_path) as corpus:
+        for number in range(200):
+            corpus.write(_job(number))
+    data = gz_path.read_bytes()
+    gz_path.write_bytes(data[:len(data) // 2])
+    jobs = list(iter_jobs(gz_path))
+    assert 0 < len(jobs) < 200
+    assert jobs == [_job(number) for number in range(len(jobs))]
@@ -0,0 +1,125 @@
+"""
+Resume Library - Tailored resume variants and per-job selection
+
+Every resume*.pdf in resume/ is a variant: resume.pdf is "default",
+resume_ml.pdf is "ml", resume_backend.pdf is "backend", and so on.
+Each variant's profile comes from the resume profile cache (parsed once
+per PDF version), and its skills become one row of a 0/1 skill matrix
+over the canonical skills of all variants.
+
+Choosing a variant for a job is then one skill scan of the description
+and a dot product; for a whole apply queue the job vectors are stacked
+and scored against every variant in a single matrix product. The
+variant covering the most of the job's skills wins, earlier variants
+(default first) on ties.
+"""
+
+from collections import namedtuple
+from pathlib import Path
+
+import numpy as np
+
+from matching.skills_index import get_skills_index
+from resume.profile_cache import PROFILE_CACHE_DIR, load_resume_profile
+
+RESUME_DIR = Path("resume")
+RESUME_PATTERN = "resume*.pdf"
+DEFAULT_VARIANT = "default"
+
+ResumeVariant = namedtuple("ResumeVariant", ["name", "path", "profile"])
+
+
+def variant_name(pdf_path: Path) -> str:
+    """Variant name of a resume file: resume_ml.pdf -> "ml", resume.pdf -> "default"."""
+    suffix = Path(pdf_path).stem[len("resume"):].strip("_- ")
+    return suffix or DEFAULT_VARIANT
+
+
+class ResumeLibrary:
+    """
+    Resume variants with precomputed skill vectors.
+
+    Usage:
+        library = ResumeLibrary()
+        variant = library.best_variant(job["description"])
+        variant.path, variant.profile
+    """
+
+    def __init__(self, directory: Path = RESUME_DIR, cache_dir: Path = PROFILE_CACHE_DIR):
+        paths = sorted(Path(directory).glob(RESUME_PATTERN),
+                       key=lambda path: (variant_name(path) != DEFAULT_VARIANT, path.name))
+        self.variants = [
+            ResumeVariant(variant_name(path), path, load_resume_profile(path, cache_dir)[0])
+            for path in paths
+        ]
+
+        index = get_skills_index()
+        skills = [skill for variant in self.variants for skill in variant.profile.get("skills", [])]
+        self._canonical_key = index.canonical_key
+        self._matcher = index.matcher(tuple(skills))
+
+        # One column per canonical skill of any variant
+        keys = sorted({index.canonical_key(skill) for skill in skills})
+        self.skill_columns = {key: column for column, key in enumerate(keys)}
+        self.skill_matrix = np.zeros((len(self.variants), len(keys)), dtype=np.float32)
+        for row, variant in enumerate(self.variants):
+            for skill in variant.profile.get("skills", []):
+                self.skill_matrix[row, self.skill_columns[index.canonical_key(skill)]] = 1.0
+
+    def __len__(self) -> int:
+        return len(self.variants)
+
+    @property
+    def names(self) -> list:
+        return [variant.name for variant in self.variants]
+
+    def get(self, name: str = DEFAULT_VARIANT):
+        """
+        Variant by name, falling back to the first (default) variant.
+
+        Returns:
+            ResumeVariant, or None for an empty library
+        """
+        for variant in self.variants:
+            if variant.name == name:
+                return variant
+        return self.variants[0] if self.variants else None
+
+    def job_vector(self, description: str) -> np.ndarray:
+        """
+        0/1 vector of the library skills a job description mentions.
+
+        Args:
+            description: Job description
+
+        Returns:
+            float32 array with one entry per skill column
+        """
+        vector = np.zeros(len(self.skill_columns), dtype=np.float32)
+        for skill in self._matcher.find_skills(description or ""):
+            column = self.skill_columns.get(self._canonical_key(skill))
+            if column is not None:
+                vector[column] = 1.0
+        return vector
+
+    def select(self, job_vectors: list) -> np.ndarray:
+        """
+        Best variant for each job, in one vectorized pass.
+
+        Args:
+            job_vectors: Vectors from job_vector(), one per job
+
+        Returns:
+            Array of variant indexes (into self.variants), one per job
+        """
+        if not job_vectors or not self.variants:
+            return np.zeros(len(job_vectors), dtype=np.intp)
+        # jobs x skills @ skills x variants: skills each variant covers per job
+        scores = np.vstack(job_vectors) @ self.skill_matrix.T
+        return scores.argmax(axis=1)
+
+    def best_variant(self, description: str):
+        """Best variant for one job description (None for an empty library)."""
+        if not self.variants:
+            return None
+        return self.variants[int(self.select([self.job_vector(description)])[0])]
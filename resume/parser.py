@@ -1,28 +1,119 @@
-import pdfplumber
-from pathlib import Path
+import os
 import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+import pdfplumber
+
+try:
+    import pypdfium2   # Installed with pdfplumber >= 0.10
+except ImportError:
+    pypdfium2 = None
+
+from matching.skills_index import get_skills_index
+
+# Bump when PDF text extraction changes, so cached resume text is re-extracted
+PARSER_VERSION = 1
+
+# Pages per worker task: a few tasks per worker balances uneven pages
+TASKS_PER_WORKER = 2
+
+
+def _extract_pages(task: tuple) -> list:
+    """
+    Worker: extract the text of a range of pages.
+
+    The document is opened once per task, in the worker, so only the
+    path and page numbers cross the process boundary.
+
+    Args:
+        task: (pdf_path, first page index, end page index or None for
+            the last page, text_only)
+
+    Returns:
+        List of (page text, seconds) in page order
+    """
+    pdf_path, first, end, text_only = task
+    pages = []
+
+    if text_only and pypdfium2 is not None:
+        # pdfium's text layer: no layout analysis, much faster
+        pdf = pypdfium2.PdfDocument(pdf_path)
+        try:
+            for index in range(first, len(pdf) if end is None else end):
+                start = time.perf_counter()
+                page = pdf[index]
+                textpage = page.get_textpage()
+                text = textpage.get_text_bounded().replace("\r\n", "\n").strip()
+                textpage.close()
+                page.close()
+                pages.append((text, time.perf_counter() - start))
+        finally:
+            pdf.close()
+        return pages
+
+    with pdfplumber.open(pdf_path) as pdf:
+        for index in range(first, len(pdf.pages) if end is None else end):
+            start = time.perf_counter()
+            page = pdf.pages[index]
+            text = page.extract_text_simple() if text_only else page.extract_text()
+            page.close()   # Release the page's parsed objects
+            pages.append((text or "", time.perf_counter() - start))
+    return pages
+
+
+def count_pages(pdf_path: str) -> int:
+    """Number of pages in a PDF."""
+    if pypdfium2 is not None:
+        pdf = pypdfium2.PdfDocument(pdf_path)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+    with pdfplumber.open(pdf_path) as pdf:
+        return len(pdf.pages)
 
 
-def extract_resume_text(pdf_path: str) -> str:
+def extract_resume_text(pdf_path: str, workers: int = 1, text_only: bool = False,
+                        page_times: list = None) -> str:
     """
     Extract text from a PDF resume.
     
+    With workers > 1 (None: all cores) pages are split into ranges that
+    are extracted in parallel worker processes and reassembled in order.
+    Worth it for multi-page documents; one-page resumes stay in-process.
+    
     Args:
         pdf_path: Path to the PDF file
+        workers: Worker processes (1: extract serially in this process)
+        text_only: Read the PDF's text layer without pdfplumber's layout
+            analysis (faster; line order follows the PDF, not the layout)
+        page_times: Optional list; seconds spent on each page are
+            appended to it, in page order
         
     Returns:
         Extracted text as a string
     """
-    text = []
+    pdf_path = str(pdf_path)
+    workers = workers or os.cpu_count() or 1
+    page_count = count_pages(pdf_path) if workers > 1 else 0
 
-    with pdfplumber.open(pdf_path) as pdf:
-        for page in pdf.pages:
-            page_text = page.extract_text()
-            if page_text:
-                text.append(page_text)
+    if workers > 1 and page_count > 1:
+        workers = min(workers, page_count)
+        size = -(-page_count // (workers * TASKS_PER_WORKER))
+        tasks = [(pdf_path, first, min(first + size, page_count), text_only)
+                 for first in range(0, page_count, size)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pages = [page for chunk in pool.map(_extract_pages, tasks) for page in chunk]
+    else:
+        pages = _extract_pages((pdf_path, 0, None, text_only))
 
-    return "\n".join(text)
+    if page_times is not None:
+        page_times.extend(seconds for _, seconds in pages)
+
+    return "\n".join(text for text, _ in pages if text)
 
 
 def save_text_to_file(text: str, output_path: str):
@@ -113,27 +204,16 @@ def extract_skills(text: str) -> list:
     """
     Extract skills from resume text using a master skills list.
     
+    Uses the shared skills index (one pass over the text, whole-word
+    matches only, variants reported by their canonical name).
+    
     Args:
         text: Resume text
         
     Returns:
         List of found skills
     """
-    skills_file = Path("data/skills_master_list.txt")
-    
-    if not skills_file.exists():
-        return []
-    
-    skills = skills_file.read_text(encoding="utf-8").splitlines()
-    text_lower = text.lower()
-    found_skills = []
-
-    for skill in skills:
-        skill = skill.strip()
-        if skill and skill.lower() in text_lower:
-            found_skills.append(skill)
-
-    return sorted(set(found_skills))
+    return sorted(get_skills_index().find_skills(text))
 
 
 def extract_experience_years(text: str) -> float:
@@ -0,0 +1,94 @@
+"""
+Resume Profile Cache - Extracted resume text keyed by the PDF
+
+pdfplumber layout analysis is the slowest part of startup, yet a resume
+rarely changes. The text extracted from each PDF is cached under a key
+made from:
+- the SHA-256 of the PDF bytes
+- PARSER_VERSION (bump when text extraction changes)
+
+The profile itself is rebuilt from that text on every load: it takes
+milliseconds, and its inputs other than the PDF (the skills index, the
+current year behind "2020 - Present" experience) can change at any time.
+Entries live in data/resume_cache/<key>.txt; the oldest are pruned
+beyond MAX_CACHED_PROFILES.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+from resume.parser import PARSER_VERSION, build_resume_profile, extract_resume_text
+
+PROFILE_CACHE_DIR = Path("data/resume_cache")
+MAX_CACHED_PROFILES = 32
+
+# Read the PDF in blocks when hashing it
+HASH_BLOCK = 1 << 20
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 hex digest of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def profile_cache_key(pdf_path: Path) -> str:
+    """
+    Cache key of a resume's extracted text.
+
+    Args:
+        pdf_path: Resume PDF
+
+    Returns:
+        Hex digest of the PDF hash and parser version
+    """
+    parts = (file_digest(pdf_path), str(PARSER_VERSION))
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _prune(cache_dir: Path, keep: int = MAX_CACHED_PROFILES):
+    """Delete all but the keep most recently used cache entries."""
+    entries = sorted(cache_dir.glob("*.txt"), key=lambda path: path.stat().st_mtime, reverse=True)
+    for path in entries[keep:]:
+        path.unlink(missing_ok=True)
+
+
+def load_resume_profile(pdf_path: Path, cache_dir: Path = PROFILE_CACHE_DIR,
+                        refresh: bool = False) -> tuple:
+    """
+    Get a resume's profile, extracting the PDF text only on a cache miss.
+
+    Args:
+        pdf_path: Resume PDF
+        cache_dir: Cache directory
+        refresh: Re-extract even if cached text exists
+
+    Returns:
+        (profile, cached): the profile dict and whether its text came
+        from the cache
+    """
+    cache_dir = Path(cache_dir)
+    path = cache_dir / (profile_cache_key(pdf_path) + ".txt")
+
+    text = None
+    if path.exists() and not refresh:
+        try:
+            text = path.read_text(encoding="utf-8")
+            os.utime(path)   # Mark as recently used for pruning
+        except OSError:
+            text = None      # Unreadable entry: extract again below
+
+    cached = text is not None
+    if not cached:
+        text = extract_resume_text(str(pdf_path))
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+        _prune(cache_dir)
+
+    return build_resume_profile(text), cached
@@ -0,0 +1,132 @@
+"""
+PDF Extraction Test - Serial vs parallel resume text extraction
+
+Checks that parallel extraction returns exactly the serial text, then
+times each mode with per-page timings.
+
+Usage:
+    python resume/test_pdf_extraction.py [PDF] [--workers N]
+
+PDF defaults to resume/resume.pdf. Parallel extraction pays off from a
+few pages up (CVs, portfolios); one-page resumes are extracted in-process.
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from resume.parser import count_pages, extract_resume_text
+
+RESUME_PDF = Path("resume/resume.pdf")
+
+
+def write_test_pdf(path: Path, pages: list):
+    """
+    Write a minimal PDF with one page per list of text lines (Helvetica).
+
+    Enough for pdfplumber and pdfium, without a PDF-writing dependency.
+    """
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in pages:
+        text = " ".join(f"({line}) Tj 0 -14 Td" for line in lines)
+        stream = f"BT /F1 11 Tf 50 780 Td {text} ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("latin-1")
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode("latin-1")
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1")
+    Path(path).write_bytes(out)
+
+
+def time_extraction(pdf_path: Path, workers: int, text_only: bool) -> tuple:
+    """
+    Extract a PDF once in the given mode.
+
+    Returns:
+        (text, wall seconds, list of per-page seconds)
+    """
+    page_times = []
+    start = time.perf_counter()
+    text = extract_resume_text(pdf_path, workers, text_only, page_times)
+    return text, time.perf_counter() - start, page_times
+
+
+def test_parallel_matches_serial(tmp_path):
+    """Parallel extraction reassembles the serial text, in page order."""
+    pdf_path = tmp_path / "cv.pdf"
+    write_test_pdf(pdf_path, [
+        [f"Page {page} line {line} Python SQL Docker" for line in range(20)]
+        for page in range(1, 7)
+    ])
+    assert count_pages(pdf_path) == 6
+
+    for text_only in (False, True):
+        page_times = []
+        serial = extract_resume_text(pdf_path, 1, text_only)
+        parallel = extract_resume_text(pdf_path, 3, text_only, page_times)
+        assert "Page 1 line 0" in serial and "Page 6 line 19" in serial
+        assert parallel == serial
+        assert len(page_times) == 6
+
+
+def test_resume_pdf_parallel_matches_serial():
+    """Same check on the real resume, when there is one."""
+    if not RESUME_PDF.exists():
+        pytest.skip(f"{RESUME_PDF} not found")
+    for text_only in (False, True):
+        serial = extract_resume_text(RESUME_PDF, 1, text_only)
+        assert extract_resume_text(RESUME_PDF, 2, text_only) == serial
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare serial and parallel PDF text extraction")
+    parser.add_argument("pdf", type=Path, nargs="?", default=RESUME_PDF, help="PDF to extract")
+    parser.add_argument("--workers", type=int, default=None, help="Parallel workers (default: all cores)")
+    args = parser.parse_args()
+
+    if not args.pdf.exists():
+        print(f"❌ PDF not found: {args.pdf}")
+        return
+
+    print("=" * 60)
+    print(f"📄 {args.pdf}: {count_pages(args.pdf)} pages")
+    print("=" * 60)
+
+    for text_only in (False, True):
+        label = "text-only" if text_only else "layout"
+        serial, serial_seconds, page_times = time_extraction(args.pdf, 1, text_only)
+        parallel, parallel_seconds, _ = time_extraction(args.pdf, args.workers, text_only)
+
+        status = "✅" if parallel == serial else "❌ text differs"
+        print(f"\n{label}: serial {serial_seconds * 1000:.0f} ms, "
+              f"parallel {parallel_seconds * 1000:.0f} ms "
+              f"(x{serial_seconds / parallel_seconds:.1f}) {status}")
+        for number, seconds in enumerate(page_times, 1):
+            print(f"   page {number:>3}: {seconds * 1000:7.1f} ms")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
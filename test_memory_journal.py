@@ -0,0 +1,88 @@
+"""
+Memory Journal Test - Crash safety of the applied-jobs journal
+
+Covers memory/memory.py on a scratch snapshot + journal:
+- a half-written trailing journal line is dropped and truncated away
+- the journal is folded into the snapshot past JOURNAL_COMPACT_BYTES
+- a fresh process rebuilds its index from snapshot + journal
+
+Usage:
+    python -m pytest test_memory_journal.py
+"""
+
+import json
+
+import pytest
+
+from memory import memory
+
+
+def _url(number: int, tracking: str = "") -> str:
+    return f"https://www.indeed.com/viewjob?jk={number:016x}{tracking}"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """memory/memory.py pointed at empty files under tmp_path."""
+    monkeypatch.setattr(memory, "MEMORY_FILE", tmp_path / "applied_jobs.json")
+    monkeypatch.setattr(memory, "JOURNAL_FILE", tmp_path / "applied_jobs.journal.jsonl")
+    monkeypatch.setattr(memory, "_index", {"signature": None, "memory": None, "keys": set()})
+    return memory
+
+
+def _restart(store):
+    """Forget the in-process index, as a new process would."""
+    store._index.update(signature=None, memory=None, keys=set())
+
+
+def test_partial_journal_line_is_dropped(store):
+    store.mark_job_applied(_url(1))
+    store.mark_job_applied(_url(2))
+    with open(store.JOURNAL_FILE, "a", encoding="utf-8") as f:
+        f.write('{"url": "' + _url(3)[:30])   # Crash mid-append
+
+    _restart(store)
+    assert store.load_memory()["applied_jobs"] == [_url(1), _url(2)]
+    assert store.JOURNAL_FILE.read_bytes().endswith(b"\n")
+
+    # The next append starts on a clean line and replays after a restart
+    store.mark_job_applied(_url(4))
+    _restart(store)
+    assert store.load_memory()["applied_jobs"] == [_url(1), _url(2), _url(4)]
+
+
+def test_journal_compacts_into_snapshot(store, monkeypatch):
+    monkeypatch.setattr(store, "JOURNAL_COMPACT_BYTES", 500)
+    for number in range(20):
+        store.mark_job_applied(_url(number))
+
+    # Compacted at least once, and never left to grow past the threshold
+    assert store.MEMORY_FILE.exists()
+    assert store.JOURNAL_FILE.stat().st_size <= 500
+    snapshot = json.loads(store.MEMORY_FILE.read_text(encoding="utf-8"))["applied_jobs"]
+    journal = [json.loads(line)["url"] for line in store.JOURNAL_FILE.read_text(encoding="utf-8").splitlines()]
+    assert snapshot + journal == [_url(number) for number in range(20)]
+
+    _restart(store)
+    assert store.get_applied_count() == 20
+
+
+def test_index_rebuilt_from_snapshot_and_journal(store):
+    store.save_memory({"applied_jobs": [_url(1), _url(2)]})
+    store.mark_job_applied(_url(3, "&from=serp&vjs=3"))
+    store.mark_job_applied(_url(1, "&tk=abc"))   # Variant of a snapshot job: no-op
+
+    _restart(store)
+    assert store.get_applied_count() == 3
+    assert store.job_already_applied(_url(3))
+    assert store.job_already_applied(_url(2, "&from=mail"))
+    assert not store.job_already_applied(_url(4))
+    # Journal entries are stored canonical, without tracking parameters
+    assert store.load_memory()["applied_jobs"][-1] == _url(3)
+
+    # A crash between snapshot replace and journal truncation replays as no-ops
+    journal = store.JOURNAL_FILE.read_bytes()
+    store.compact_memory()
+    store.JOURNAL_FILE.write_bytes(journal)
+    _restart(store)
+    assert store.load_memory()["applied_jobs"] == [_url(1), _url(2), _url(3)]